@@ -4,12 +4,18 @@
 设置系统日志格式和输出目标。
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from typing import Optional
 
 
+# 后台日志监听器（负责实际的控制台/文件写入）
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(log_level: str = 'INFO', 
                  log_file: Optional[str] = None,
                  log_format: Optional[str] = None) -> None:
@@ -21,6 +27,8 @@ def setup_logging(log_level: str = 'INFO',
         log_file: 日志文件路径
         log_format: 日志格式
     """
+    global _listener
+    
     # 默认日志格式
     if log_format is None:
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -29,7 +37,10 @@ def setup_logging(log_level: str = 'INFO',
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
-    # 清除现有处理器
+    # 停止旧的监听器，清除现有处理器
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -40,7 +51,7 @@ def setup_logging(log_level: str = 'INFO',
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # 文件处理器
     if log_file:
@@ -55,7 +66,15 @@ def setup_logging(log_level: str = 'INFO',
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # 事件循环线程只负责入队，磁盘写入和日志轮转由后台监听线程完成
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
     
     # 设置第三方库日志级别
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -64,6 +83,17 @@ def setup_logging(log_level: str = 'INFO',
     logging.info(f"日志系统初始化完成, 级别: {log_level}")
 
 
+def _stop_listener() -> None:
+    """进程退出时刷新并停止后台日志监听器"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """获取日志器"""
     return logging.getLogger(name)
\ No newline at end of file
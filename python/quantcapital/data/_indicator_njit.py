@@ -0,0 +1,147 @@
+"""
+技术指标计算内核
+
+基于NumPy数组的单次遍历实现，使用numba编译为机器码。
+结果与pandas的rolling(min_periods=1)/ewm(adjust=True)口径一致，
+包括缺失（非有限）值：滚动窗口只统计有效值，EWM跨过缺失值时只衰减权重。
+未安装numba时退化为纯Python循环（结果相同，仅速度较慢）。
+"""
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    logger.warning("未安装numba，技术指标将使用纯Python实现，请运行: pip install numba")
+
+    def njit(*args, **kwargs):
+        """numba缺失时的兼容装饰器，直接返回原函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ma_njit(close: np.ndarray, window: int) -> np.ndarray:
+    """移动平均线（滑动窗口内有效值的累加和，窗口内无有效值时为NaN）"""
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        if np.isfinite(close[i]):
+            total += close[i]
+            count += 1
+        if i >= window and np.isfinite(close[i - window]):
+            total -= close[i - window]
+            count -= 1
+        if count > 0:
+            out[i] = total / count
+        else:
+            # 清除累计误差
+            total = 0.0
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def ewm_njit(close: np.ndarray, span: int) -> np.ndarray:
+    """指数加权移动平均（adjust=True，按权重和归一化；缺失值只衰减权重，ignore_na=False口径）"""
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(n):
+        if np.isfinite(close[i]):
+            numerator = close[i] + decay * numerator
+            denominator = 1.0 + decay * denominator
+        else:
+            numerator *= decay
+            denominator *= decay
+        out[i] = numerator / denominator if denominator > 0.0 else np.nan
+    return out
+
+
+@njit(cache=True)
+def macd_njit(close: np.ndarray, fast: int, slow: int, signal: int):
+    """MACD指标，返回(dif, dea, histogram)"""
+    dif = ewm_njit(close, fast) - ewm_njit(close, slow)
+    dea = ewm_njit(dif, signal)
+    histogram = (dif - dea) * 2
+    return dif, dea, histogram
+
+
+@njit(cache=True)
+def rsi_njit(close: np.ndarray, window: int) -> np.ndarray:
+    """RSI指标（窗口内平均涨幅/平均跌幅，滑动累加；与缺失值相邻的涨跌幅按0计）"""
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    gains = np.zeros(n, dtype=np.float64)
+    losses = np.zeros(n, dtype=np.float64)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= window:
+            gain_sum -= gains[i - window]
+            loss_sum -= losses[i - window]
+
+        # 窗口内无下跌时RSI为100，无涨跌时无定义
+        if loss_sum <= 0.0:
+            out[i] = 100.0 if gain_sum > 0.0 else np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+    return out
+
+
+@njit(cache=True)
+def bbands_njit(close: np.ndarray, window: int, std_dev: float):
+    """布林带，返回(upper, middle, lower)，标准差为样本标准差(ddof=1)"""
+    n = close.shape[0]
+    upper = np.empty(n, dtype=np.float64)
+    middle = np.empty(n, dtype=np.float64)
+    lower = np.empty(n, dtype=np.float64)
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for i in range(n):
+        if np.isfinite(close[i]):
+            total += close[i]
+            total_sq += close[i] * close[i]
+            count += 1
+        if i >= window and np.isfinite(close[i - window]):
+            old = close[i - window]
+            total -= old
+            total_sq -= old * old
+            count -= 1
+
+        if count == 0:
+            # 窗口内无有效值，清除累计误差
+            total = 0.0
+            total_sq = 0.0
+            middle[i] = np.nan
+            upper[i] = np.nan
+            lower[i] = np.nan
+            continue
+        mean = total / count
+        middle[i] = mean
+        if count < 2:
+            upper[i] = np.nan
+            lower[i] = np.nan
+        else:
+            var = (total_sq - total * mean) / (count - 1)
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            upper[i] = mean + std * std_dev
+            lower[i] = mean - std * std_dev
+    return upper, middle, lower
@@ -8,6 +8,7 @@ import time
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
 from ..entities.bar import Bar, Frequency
 
@@ -15,6 +16,42 @@ from ..entities.bar import Bar, Frequency
 logger = logging.getLogger(__name__)
 
 
+# 代码前缀 -> 交易所后缀
+_STOCK_EXCHANGE_PREFIXES = (
+    (('60', '68'), '.SH'),  # 上交所
+    (('00', '30'), '.SZ'),  # 深交所
+    (('8', '4'), '.BJ'),    # 北交所
+)
+_ETF_EXCHANGE_PREFIXES = (
+    (('51', '50'), '.SH'),
+    (('15', '16'), '.SZ'),
+)
+
+# 主要指数代码
+_MAJOR_INDICES = (
+    "000001.SH",  # 上证指数
+    "399001.SZ",  # 深证成指
+    "399006.SZ",  # 创业板指
+    "000300.SH",  # 沪深300
+    "000905.SH",  # 中证500
+    "000852.SH",  # 中证1000
+    "399905.SZ",  # 中证500（深交所）
+    "000016.SH",  # 上证50
+    "000010.SH",  # 上证180
+)
+
+
+def _codes_to_symbols(codes: pd.Series, prefixes) -> List[str]:
+    """按代码前缀批量添加交易所后缀，无法识别交易所的代码被丢弃"""
+    codes = codes.astype(str)
+    conditions = [codes.str.startswith(prefix) for prefix, _ in prefixes]
+    suffixes = pd.Series(
+        np.select(conditions, [suffix for _, suffix in prefixes], default=''),
+        index=codes.index
+    )
+    return (codes + suffixes)[suffixes != ''].tolist()
+
+
 class AKShareDataSource:
     """AKShare数据源"""
     
@@ -46,16 +83,8 @@ class AKShareDataSource:
             stock_zh_a_spot = self.ak.stock_zh_a_spot_em()
             
             if stock_zh_a_spot is not None and not stock_zh_a_spot.empty:
-                # 提取股票代码，格式化为标准形式
-                for _, row in stock_zh_a_spot.iterrows():
-                    code = row['代码']
-                    # 根据代码判断交易所
-                    if code.startswith('60') or code.startswith('68'):
-                        symbols.append(f"{code}.SH")  # 上交所
-                    elif code.startswith('00') or code.startswith('30'):
-                        symbols.append(f"{code}.SZ")  # 深交所
-                    elif code.startswith('8') or code.startswith('4'):
-                        symbols.append(f"{code}.BJ")  # 北交所
+                # 提取股票代码，根据代码前缀判断交易所
+                symbols = _codes_to_symbols(stock_zh_a_spot['代码'], _STOCK_EXCHANGE_PREFIXES)
                         
             logger.info(f"获取到 {len(symbols)} 支A股")
             time.sleep(self.request_delay)
@@ -76,13 +105,8 @@ class AKShareDataSource:
             fund_etf_spot = self.ak.fund_etf_spot_em()
             
             if fund_etf_spot is not None and not fund_etf_spot.empty:
-                for _, row in fund_etf_spot.iterrows():
-                    code = row['代码']
-                    # ETF代码格式化
-                    if code.startswith('51') or code.startswith('50'):
-                        symbols.append(f"{code}.SH")
-                    elif code.startswith('15') or code.startswith('16'):
-                        symbols.append(f"{code}.SZ")
+                # ETF代码格式化
+                symbols = _codes_to_symbols(fund_etf_spot['代码'], _ETF_EXCHANGE_PREFIXES)
                         
             logger.info(f"获取到 {len(symbols)} 支ETF")
             time.sleep(self.request_delay)
@@ -96,18 +120,7 @@ class AKShareDataSource:
     def get_index_list(self) -> List[str]:
         """获取主要指数列表"""
         try:
-            # 主要指数代码
-            major_indices = [
-                "000001.SH",  # 上证指数
-                "399001.SZ",  # 深证成指
-                "399006.SZ",  # 创业板指
-                "000300.SH",  # 沪深300
-                "000905.SH",  # 中证500
-                "000852.SH",  # 中证1000
-                "399905.SZ",  # 中证500（深交所）
-                "000016.SH",  # 上证50
-                "000010.SH",  # 上证180
-            ]
+            major_indices = list(_MAJOR_INDICES)
             
             logger.info(f"使用预定义主要指数: {len(major_indices)} 个")
             return major_indices
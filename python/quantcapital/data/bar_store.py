@@ -0,0 +1,114 @@
+"""
+列式K线内存存储
+
+回测预加载后按股票保存按时间升序排列的NumPy列数组（struct-of-arrays），
+时间范围查询通过二分查找定位，无需经过SQL查询。各列数组为只读，
+多个查询共享同一份数据，返回给调用方的DataFrame为独立副本。
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from ..entities.bar import Bar, Frequency
+from .storage import _OPTIONAL_FLOAT_COLUMNS
+
+
+@dataclass
+class SoABars:
+    """单只股票的列式K线数据（按时间升序）"""
+    symbol: str
+    datetime: np.ndarray               # datetime64[ns]
+    columns: Dict[str, np.ndarray]     # 其余各列，与datetime等长
+
+    def __len__(self) -> int:
+        return len(self.datetime)
+
+    def locate(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """定位 [start, end] 时间范围对应的下标区间 [i, j)"""
+        i = np.searchsorted(self.datetime, np.datetime64(start, 'ns'), side='left')
+        j = np.searchsorted(self.datetime, np.datetime64(end, 'ns'), side='right')
+        return int(i), int(j)
+
+    def latest_index(self, dt: datetime) -> int:
+        """不晚于dt的最后一根K线的下标，不存在时返回-1"""
+        return int(np.searchsorted(self.datetime, np.datetime64(dt, 'ns'), side='right')) - 1
+
+    def bar_at(self, i: int, frequency: Frequency) -> Bar:
+        """直接从列数组构建第i根K线，不经过DataFrame"""
+        values = {}
+        for name, column in self.columns.items():
+            value = column[i]
+            values[name] = value.item() if isinstance(value, np.generic) else value
+
+        def optional(name: str):
+            value = values.get(name)
+            return None if value is None or value != value else value
+
+        def flag(name: str) -> bool:
+            value = optional(name)
+            return bool(value) if value is not None else False
+
+        return Bar(
+            symbol=self.symbol,
+            datetime=pd.Timestamp(self.datetime[i]),
+            frequency=frequency,
+            open=values['open'],
+            high=values['high'],
+            low=values['low'],
+            close=values['close'],
+            volume=values['volume'],
+            amount=values['amount'],
+            turnover=optional('turnover') or 0.0,
+            is_st=flag('is_st'),
+            is_new_stock=flag('is_new_stock'),
+            **{name: optional(name) for name in _OPTIONAL_FLOAT_COLUMNS}
+        )
+
+    def to_frame(self, i: int, j: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """将下标区间 [i, j) 转换为DataFrame（复制切片，调用方可自由修改）"""
+        names = columns if columns is not None else list(self.columns)
+        data = {'symbol': np.full(j - i, self.symbol, dtype=object), 'datetime': self.datetime[i:j].copy()}
+        for name in names:
+            if name in self.columns:
+                data[name] = self.columns[name][i:j].copy()
+        return pd.DataFrame(data, copy=False)
+
+
+def build_soa_store(df: pd.DataFrame) -> Dict[str, SoABars]:
+    """
+    将K线数据按股票拆分为列式存储
+
+    Args:
+        df: K线数据，包含symbol和datetime列
+
+    Returns:
+        股票代码 -> SoABars，各列为整体数组的只读切片视图
+    """
+    if df.empty:
+        return {}
+
+    df = df.sort_values(['symbol', 'datetime'], kind='stable')
+    symbols = df['symbol'].to_numpy()
+    datetimes = pd.to_datetime(df['datetime']).to_numpy(dtype='datetime64[ns]')
+    arrays = {name: df[name].to_numpy() for name in df.columns if name not in ('symbol', 'datetime')}
+    # 切片视图由所有查询共享，设为只读防止调用方修改影响后续查询
+    for values in (datetimes, *arrays.values()):
+        values.flags.writeable = False
+
+    # 相邻行股票代码变化处即为分组边界
+    boundaries = np.flatnonzero(symbols[1:] != symbols[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(symbols)]))
+
+    store = {}
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        symbol = symbols[start]
+        store[symbol] = SoABars(
+            symbol=symbol,
+            datetime=datetimes[start:end],
+            columns={name: values[start:end] for name, values in arrays.items()}
+        )
+    return store
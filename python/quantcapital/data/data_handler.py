@@ -7,16 +7,22 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Dict, Optional, Any
+import numpy as np
 import pandas as pd
 from ..entities.bar import Bar, Frequency
 from ..entities.calendar import Calendar
 from ..entities.universe import Universe
-from .storage import ParquetStorage, DuckDBStorage, SQLiteBusinessStorage
+from .storage import ParquetStorage, DuckDBStorage, SQLiteBusinessStorage, dataframe_to_bars
+from .bar_store import SoABars, build_soa_store
 
 
 logger = logging.getLogger(__name__)
 
+# 从Bar取收盘价（C实现，配合map在C层完成逐个取值）
+_get_close = attrgetter('close')
+
 
 class DataHandler(ABC):
     """数据处理器基类"""
@@ -26,8 +32,9 @@ class DataHandler(ABC):
         
     @abstractmethod
     def get_bars(self, symbols: List[str], start_date: datetime, 
-                 end_date: datetime, frequency: Frequency) -> pd.DataFrame:
-        """获取历史K线数据"""
+                 end_date: datetime, frequency: Frequency,
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """获取历史K线数据（columns指定只读取的列，如仅需OHLC时跳过指标列）"""
         pass
     
     @abstractmethod
@@ -41,6 +48,11 @@ class DataHandler(ABC):
         """获取多个股票的最新K线数据"""
         pass
     
+    def get_latest_closes(self, symbol: str, frequency: Frequency, count: int) -> np.ndarray:
+        """获取最近count根K线的收盘价数组（按时间升序），供均线等指标直接做数组运算"""
+        bars = self.get_latest_bars([symbol], frequency, count).get(symbol, [])
+        return np.fromiter(map(_get_close, bars), dtype=np.float64, count=len(bars))
+    
     @abstractmethod
     def get_universe(self, date: datetime) -> List[str]:
         """获取指定日期的股票池"""
@@ -72,39 +84,79 @@ class BacktestDataHandler(DataHandler):
         self.duckdb_storage = DuckDBStorage()  # 内存数据库用于快速查询
         self.business_storage = SQLiteBusinessStorage(business_db_path)
         self.calendar = Calendar()
-        self._cached_data: Dict[str, Any] = {}
+        # 预加载数据的列式存储：频率 -> 股票代码 -> SoABars
+        self._soa: Dict[Frequency, Dict[str, SoABars]] = {}
+        
+        # 回测期间股票池和交易日历不变，缓存查询结果避免每根K线访问数据库/日历
+        self._universe_cache: Dict[int, List[str]] = {}
+        self._trading_day_cache: Dict[int, bool] = {}
+        self._load_universe_to_duckdb()
         
         logger.info("回测数据处理器初始化完成")
     
     def load_data_to_memory(self, symbols: List[str], start_date: datetime, 
                           end_date: datetime, frequency: Frequency):
         """预加载数据到内存（回测开始前调用）"""
+        self.clear_caches()
+        self._load_universe_to_duckdb()
         logger.info(f"预加载数据到内存: {len(symbols)}支股票, "
                    f"{start_date.date()}-{end_date.date()}, {frequency.value}")
         
-        # 从Parquet加载数据到DuckDB
-        df = self.parquet_storage.load_bars(symbols, start_date, end_date, frequency)
-        if not df.empty:
-            bars = self._dataframe_to_bars(df)
-            self.duckdb_storage.save_bars(bars, frequency)
-            logger.info(f"数据预加载完成: {len(bars)}条K线")
+        # 从Parquet加载Arrow表直接写入DuckDB，不构建中间的Bar对象
+        table = self.parquet_storage.load_table(symbols, start_date, end_date, frequency)
+        if table is not None and table.num_rows > 0:
+            self.duckdb_storage.save_dataframe(table, frequency)
+            self._soa[frequency] = build_soa_store(table.to_pandas())
+            logger.info(f"数据预加载完成: {table.num_rows}条K线")
         else:
             logger.warning("未找到任何数据")
     
     def get_bars(self, symbols: List[str], start_date: datetime, 
-                 end_date: datetime, frequency: Frequency) -> pd.DataFrame:
+                 end_date: datetime, frequency: Frequency,
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
         """获取历史K线数据"""
         # 确保不访问未来数据
         if self.current_time and end_date > self.current_time:
             end_date = self.current_time
+        
+        # 已预加载的股票直接从列式存储切片，否则回退到DuckDB查询
+        store = self._soa.get(frequency)
+        if store is not None and all(symbol in store for symbol in symbols):
+            return self._get_bars_from_store(store, symbols, start_date, end_date, columns)
             
-        return self.duckdb_storage.load_bars(symbols, start_date, end_date, frequency)
+        return self.duckdb_storage.load_bars(symbols, start_date, end_date, frequency, columns)
+    
+    def _get_bars_from_store(self, store: Dict[str, SoABars], symbols: List[str],
+                             start_date: datetime, end_date: datetime,
+                             columns: Optional[List[str]]) -> pd.DataFrame:
+        """从列式存储获取K线数据，按(symbol, datetime)排序"""
+        frames = []
+        for symbol in sorted(set(symbols)):
+            soa = store[symbol]
+            i, j = soa.locate(start_date, end_date)
+            if j > i:
+                frames.append(soa.to_frame(i, j, columns))
+        
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
     
     def get_latest_bar(self, symbol: str, frequency: Frequency) -> Optional[Bar]:
         """获取最新的K线数据"""
         if not self.current_time:
             logger.warning("当前时间未设置")
             return None
+        
+        # 已预加载的股票：在时间数组上二分查找，直接从列数组构建Bar；
+        # 与下方查询相同，只返回向前30天内的K线（长期停牌的股票不返回过期价格）
+        soa = self._soa.get(frequency, {}).get(symbol)
+        if soa is not None:
+            i = soa.latest_index(self.current_time)
+            if i < 0 or soa.datetime[i] < np.datetime64(self.current_time - timedelta(days=30), 'ns'):
+                return None
+            return soa.bar_at(i, frequency)
             
         # 获取当前时间之前的最新数据
         df = self.get_bars([symbol], 
@@ -116,8 +168,7 @@ class BacktestDataHandler(DataHandler):
             return None
             
         # 返回最新的一条
-        latest_row = df.iloc[-1]
-        return self._row_to_bar(latest_row)
+        return dataframe_to_bars(df.iloc[-1:])[0]
     
     def get_latest_bars(self, symbols: List[str], frequency: Frequency, 
                        count: int = 1) -> Dict[str, List[Bar]]:
@@ -126,93 +177,66 @@ class BacktestDataHandler(DataHandler):
             logger.warning("当前时间未设置")
             return {}
             
-        result = {}
+        result = {symbol: [] for symbol in symbols}
+        start_date = self.current_time - timedelta(days=60)  # 向前60天查找
+        
+        # 已预加载的股票：二分定位后直接从列数组构建最后count根Bar，不经过DataFrame
+        store = self._soa.get(frequency)
+        if store is not None and all(symbol in store for symbol in symbols):
+            for symbol in symbols:
+                soa = store[symbol]
+                i, j = soa.locate(start_date, self.current_time)
+                result[symbol] = [soa.bar_at(k, frequency) for k in range(max(i, j - count), j)]
+            return result
         
         # 获取所有股票的数据
-        df = self.get_bars(symbols,
-                          self.current_time - timedelta(days=60),  # 向前60天查找
-                          self.current_time,
-                          frequency)
+        df = self.get_bars(symbols, start_date, self.current_time, frequency)
         
-        # 按股票分组并获取最新数据
-        for symbol in symbols:
-            symbol_df = df[df['symbol'] == symbol].tail(count)
-            if not symbol_df.empty:
-                bars = [self._row_to_bar(row) for _, row in symbol_df.iterrows()]
-                result[symbol] = bars
-            else:
-                result[symbol] = []
+        # 数据已按(symbol, datetime)排序，一次groupby取每只股票最后count条
+        if not df.empty:
+            latest = df.groupby('symbol', sort=False).tail(count)
+            for bar in dataframe_to_bars(latest):
+                result[bar.symbol].append(bar)
         
         return result
     
+    def get_latest_closes(self, symbol: str, frequency: Frequency, count: int) -> np.ndarray:
+        """获取最近count根K线的收盘价数组（已预加载时为只读的列数组切片视图）"""
+        soa = self._soa.get(frequency, {}).get(symbol)
+        if soa is None or not self.current_time:
+            return super().get_latest_closes(symbol, frequency, count)
+        
+        # 与get_latest_bars相同，只取向前60天内的K线
+        i, j = soa.locate(self.current_time - timedelta(days=60), self.current_time)
+        return soa.columns['close'][max(i, j - count):j]
+    
     def get_universe(self, date: datetime) -> List[str]:
-        """获取指定日期的股票池"""
-        # 简化实现，返回默认股票池
-        return self.business_storage.load_universe("default")
+        """获取指定日期的股票池（返回缓存列表，调用方不应修改）"""
+        key = date.toordinal()
+        universe = self._universe_cache.get(key)
+        if universe is None:
+            universe = self.duckdb_storage.load_universe("default", date)
+            self._universe_cache[key] = universe
+        return universe
+    
+    def _load_universe_to_duckdb(self):
+        """将默认股票池及上市日期从SQLite载入DuckDB，供按日期查询"""
+        members = self.business_storage.load_universe_members("default")
+        self.duckdb_storage.save_universe("default", members)
     
     def is_trading_day(self, date: datetime) -> bool:
         """判断是否交易日"""
-        return self.calendar.is_trading_day(date)
-    
-    def _dataframe_to_bars(self, df: pd.DataFrame) -> List[Bar]:
-        """将DataFrame转换为Bar对象列表"""
-        bars = []
-        for _, row in df.iterrows():
-            bar = Bar(
-                symbol=row['symbol'],
-                datetime=pd.to_datetime(row['datetime']),
-                frequency=Frequency(row['frequency']),
-                open=row['open'],
-                high=row['high'],
-                low=row['low'],
-                close=row['close'],
-                volume=row['volume'],
-                amount=row['amount'],
-                turnover=row.get('turnover', 0.0),
-                ma5=row.get('ma5'),
-                ma20=row.get('ma20'),
-                ma60=row.get('ma60'),
-                macd_dif=row.get('macd_dif'),
-                macd_dea=row.get('macd_dea'),
-                macd_histogram=row.get('macd_histogram'),
-                rsi_14=row.get('rsi_14'),
-                boll_upper=row.get('boll_upper'),
-                boll_lower=row.get('boll_lower'),
-                market_cap=row.get('market_cap'),
-                circulating_market_cap=row.get('circulating_market_cap'),
-                is_st=row.get('is_st', False),
-                is_new_stock=row.get('is_new_stock', False)
-            )
-            bars.append(bar)
-        return bars
+        key = date.toordinal()
+        result = self._trading_day_cache.get(key)
+        if result is None:
+            result = self.calendar.is_trading_day(date)
+            self._trading_day_cache[key] = result
+        return result
     
-    def _row_to_bar(self, row: pd.Series) -> Bar:
-        """将DataFrame行转换为Bar对象"""
-        return Bar(
-            symbol=row['symbol'],
-            datetime=pd.to_datetime(row['datetime']),
-            frequency=Frequency(row['frequency']),
-            open=row['open'],
-            high=row['high'],
-            low=row['low'],
-            close=row['close'],
-            volume=row['volume'],
-            amount=row['amount'],
-            turnover=row.get('turnover', 0.0),
-            ma5=row.get('ma5'),
-            ma20=row.get('ma20'),
-            ma60=row.get('ma60'),
-            macd_dif=row.get('macd_dif'),
-            macd_dea=row.get('macd_dea'),
-            macd_histogram=row.get('macd_histogram'),
-            rsi_14=row.get('rsi_14'),
-            boll_upper=row.get('boll_upper'),
-            boll_lower=row.get('boll_lower'),
-            market_cap=row.get('market_cap'),
-            circulating_market_cap=row.get('circulating_market_cap'),
-            is_st=row.get('is_st', False),
-            is_new_stock=row.get('is_new_stock', False)
-        )
+    def clear_caches(self):
+        """清空股票池和交易日缓存（股票池或日历更新后调用）"""
+        self._universe_cache.clear()
+        self._trading_day_cache.clear()
 
 
 class LiveDataHandler(DataHandler):
@@ -235,14 +259,15 @@ class LiveDataHandler(DataHandler):
         logger.info("实盘数据处理器初始化完成")
     
     def get_bars(self, symbols: List[str], start_date: datetime, 
-                 end_date: datetime, frequency: Frequency) -> pd.DataFrame:
+                 end_date: datetime, frequency: Frequency,
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
         """获取历史K线数据"""
         # 实盘模式确保不访问未来数据
         now = datetime.now()
         if end_date > now:
             end_date = now
             
-        return self.parquet_storage.load_bars(symbols, start_date, end_date, frequency)
+        return self.parquet_storage.load_bars(symbols, start_date, end_date, frequency, columns)
     
     def get_latest_bar(self, symbol: str, frequency: Frequency) -> Optional[Bar]:
         """获取最新的K线数据"""
@@ -258,14 +283,13 @@ class LiveDataHandler(DataHandler):
             return None
             
         # 返回最新的一条
-        latest_row = df.iloc[-1]
-        return self._row_to_bar(latest_row)
+        return dataframe_to_bars(df.iloc[-1:])[0]
     
     def get_latest_bars(self, symbols: List[str], frequency: Frequency, 
                        count: int = 1) -> Dict[str, List[Bar]]:
         """获取多个股票的最新K线数据"""
         now = datetime.now()
-        result = {}
+        result = {symbol: [] for symbol in symbols}
         
         # 获取所有股票的数据
         df = self.get_bars(symbols,
@@ -273,14 +297,11 @@ class LiveDataHandler(DataHandler):
                           now,
                           frequency)
         
-        # 按股票分组并获取最新数据
-        for symbol in symbols:
-            symbol_df = df[df['symbol'] == symbol].tail(count)
-            if not symbol_df.empty:
-                bars = [self._row_to_bar(row) for _, row in symbol_df.iterrows()]
-                result[symbol] = bars
-            else:
-                result[symbol] = []
+        # 数据已按(symbol, datetime)排序，一次groupby取每只股票最后count条
+        if not df.empty:
+            latest = df.groupby('symbol', sort=False).tail(count)
+            for bar in dataframe_to_bars(latest):
+                result[bar.symbol].append(bar)
         
         return result
     
@@ -291,31 +312,3 @@ class LiveDataHandler(DataHandler):
     def is_trading_day(self, date: datetime) -> bool:
         """判断是否交易日"""
         return self.calendar.is_trading_day(date)
-    
-    def _row_to_bar(self, row: pd.Series) -> Bar:
-        """将DataFrame行转换为Bar对象"""
-        return Bar(
-            symbol=row['symbol'],
-            datetime=pd.to_datetime(row['datetime']),
-            frequency=Frequency(row['frequency']),
-            open=row['open'],
-            high=row['high'],
-            low=row['low'],
-            close=row['close'],
-            volume=row['volume'],
-            amount=row['amount'],
-            turnover=row.get('turnover', 0.0),
-            ma5=row.get('ma5'),
-            ma20=row.get('ma20'),
-            ma60=row.get('ma60'),
-            macd_dif=row.get('macd_dif'),
-            macd_dea=row.get('macd_dea'),
-            macd_histogram=row.get('macd_histogram'),
-            rsi_14=row.get('rsi_14'),
-            boll_upper=row.get('boll_upper'),
-            boll_lower=row.get('boll_lower'),
-            market_cap=row.get('market_cap'),
-            circulating_market_cap=row.get('circulating_market_cap'),
-            is_st=row.get('is_st', False),
-            is_new_stock=row.get('is_new_stock', False)
-        )
\ No newline at end of file
@@ -5,38 +5,40 @@
 独立进程运行，通过事件驱动与主系统通信。
 """
 
+import os
 import time
+import pickle
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
 from ..entities.bar import Bar, Frequency
 from ..entities.event import TimerEvent
 from ..engine.event_engine import EventEngine, EventHandler
 from ..engine.timer import TimerManager
-from .storage import ParquetStorage, SQLiteBusinessStorage
+from .storage import ParquetStorage, SQLiteBusinessStorage, dataframe_to_bars
+from ._indicator_njit import ma_njit, macd_njit, rsi_njit, bbands_njit
+from .indicator_state import IndicatorState
 
 
 logger = logging.getLogger(__name__)
 
 
 class TechnicalIndicators:
-    """技术指标计算器"""
+    """技术指标计算器（输入输出均为float64数组）"""
     
     @staticmethod
-    def calculate_ma(prices: pd.Series, window: int) -> pd.Series:
+    def calculate_ma(prices: np.ndarray, window: int) -> np.ndarray:
         """计算移动平均线"""
-        return prices.rolling(window=window, min_periods=1).mean()
+        return ma_njit(prices, window)
     
     @staticmethod
-    def calculate_macd(prices: pd.Series, fast=12, slow=26, signal=9) -> Dict[str, pd.Series]:
+    def calculate_macd(prices: np.ndarray, fast=12, slow=26, signal=9) -> Dict[str, np.ndarray]:
         """计算MACD指标"""
-        exp_fast = prices.ewm(span=fast).mean()
-        exp_slow = prices.ewm(span=slow).mean()
-        dif = exp_fast - exp_slow
-        dea = dif.ewm(span=signal).mean()
-        histogram = (dif - dea) * 2
+        dif, dea, histogram = macd_njit(prices, fast, slow, signal)
         
         return {
             'dif': dif,
@@ -45,28 +47,39 @@ class TechnicalIndicators:
         }
     
     @staticmethod
-    def calculate_rsi(prices: pd.Series, window: int = 14) -> pd.Series:
+    def calculate_rsi(prices: np.ndarray, window: int = 14) -> np.ndarray:
         """计算RSI指标"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window, min_periods=1).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window, min_periods=1).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return rsi_njit(prices, window)
     
     @staticmethod
-    def calculate_bollinger_bands(prices: pd.Series, window: int = 20, std_dev: float = 2) -> Dict[str, pd.Series]:
+    def calculate_bollinger_bands(prices: np.ndarray, window: int = 20, std_dev: float = 2) -> Dict[str, np.ndarray]:
         """计算布林带"""
-        ma = prices.rolling(window=window, min_periods=1).mean()
-        std = prices.rolling(window=window, min_periods=1).std()
+        upper, middle, lower = bbands_njit(prices, window, float(std_dev))
         
         return {
-            'upper': ma + (std * std_dev),
-            'lower': ma - (std * std_dev),
-            'middle': ma
+            'upper': upper,
+            'lower': lower,
+            'middle': middle
         }
 
 
+def _compute_indicators(close_prices: np.ndarray) -> Dict[str, np.ndarray]:
+    """计算单只股票的全部技术指标"""
+    macd = TechnicalIndicators.calculate_macd(close_prices)
+    boll = TechnicalIndicators.calculate_bollinger_bands(close_prices, 20)
+    return {
+        'ma5': TechnicalIndicators.calculate_ma(close_prices, 5),
+        'ma20': TechnicalIndicators.calculate_ma(close_prices, 20),
+        'ma60': TechnicalIndicators.calculate_ma(close_prices, 60),
+        'macd_dif': macd['dif'],
+        'macd_dea': macd['dea'],
+        'macd_histogram': macd['histogram'],
+        'rsi_14': TechnicalIndicators.calculate_rsi(close_prices, 14),
+        'boll_upper': boll['upper'],
+        'boll_lower': boll['lower'],
+    }
+
+
 from .akshare_source import AKShareDataSource
 
 
@@ -98,6 +111,13 @@ class DataUpdater(EventHandler):
         # 技术指标计算器
         self.indicators = TechnicalIndicators()
         
+        # 增量指标状态：(频率, 股票) -> IndicatorState，只对新K线计算指标
+        self.incremental_indicators = config.get('incremental_indicators', True)
+        self._indicator_state_path = Path(data_root) / "_indicator_state.pkl"
+        self._indicator_state: Dict[Tuple[str, str], IndicatorState] = (
+            self._load_indicator_state() if self.incremental_indicators else {}
+        )
+        
         # 定时器管理器
         self.timer_manager = TimerManager()
         
@@ -146,8 +166,30 @@ class DataUpdater(EventHandler):
             # 更新不同频率的数据
             frequencies = [Frequency.HOURLY, Frequency.DAILY]
             
-            for frequency in frequencies:
-                self._update_frequency_data(symbols, frequency)
+            # 按频率和股票分片并行获取数据（主要耗时为网络IO），每个频率汇总后只写一次Parquet
+            chunk_size = self.config.get('update_chunk_size', 20)
+            chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+            max_workers = self.config.get('update_workers', 4)
+            
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DataUpdater") as executor:
+                futures = {
+                    frequency: [executor.submit(self._fetch_frequency_bars, chunk, frequency)
+                                for chunk in chunks]
+                    for frequency in frequencies
+                }
+                state_updated = False
+                for frequency, frequency_futures in futures.items():
+                    bars = []
+                    states = {}
+                    for future in frequency_futures:
+                        chunk_bars, chunk_states = future.result()
+                        bars.extend(chunk_bars)
+                        states.update(chunk_states)
+                    if self._save_frequency_bars(bars, frequency, states) and states:
+                        state_updated = True
+            
+            if state_updated:
+                self._save_indicator_state()
             
             logger.info("K线数据更新完成")
             
@@ -171,6 +213,18 @@ class DataUpdater(EventHandler):
     
     def _update_frequency_data(self, symbols: List[str], frequency: Frequency):
         """更新指定频率的数据"""
+        bars, states = self._fetch_frequency_bars(symbols, frequency)
+        if self._save_frequency_bars(bars, frequency, states) and states:
+            self._save_indicator_state()
+    
+    def _fetch_frequency_bars(self, symbols: List[str], frequency: Frequency
+                              ) -> Tuple[List[Bar], Dict[Tuple[str, str], IndicatorState]]:
+        """
+        获取指定频率的数据并计算技术指标（可在工作线程中执行）
+        
+        Returns:
+            (K线列表, 更新后的指标状态)，指标状态由_save_frequency_bars在K线保存成功后提交
+        """
         try:
             logger.info(f"更新{frequency.value}数据: {len(symbols)}支股票")
             
@@ -191,75 +245,123 @@ class DataUpdater(EventHandler):
             
             if df.empty:
                 logger.warning(f"未获取到{frequency.value}数据")
-                return
+                return [], {}
             
             # 转换为Bar对象并计算技术指标
-            bars = self._dataframe_to_bars_with_indicators(df, frequency)
-            
-            # 保存数据
-            if self.parquet_storage.save_bars(bars, frequency):
-                logger.info(f"{frequency.value}数据保存成功: {len(bars)}条")
-            else:
-                logger.error(f"{frequency.value}数据保存失败")
+            if self.incremental_indicators:
+                return self._dataframe_to_bars_incremental(df, frequency)
+            return self._dataframe_to_bars_with_indicators(df, frequency), {}
                 
         except Exception as e:
             logger.error(f"更新{frequency.value}数据失败: {e}", exc_info=True)
+            return [], {}
+    
+    def _save_frequency_bars(self, bars: List[Bar], frequency: Frequency,
+                             states: Optional[Dict[Tuple[str, str], IndicatorState]] = None) -> bool:
+        """
+        保存指定频率的数据
+        
+        K线保存成功后才提交对应的指标状态；保存失败时状态保持不变，
+        下次更新会重新获取并计算这些K线。
+        
+        Returns:
+            是否保存成功（无新增K线视为成功）
+        """
+        if not bars:
+            logger.info(f"{frequency.value}数据无新增K线")
+            return True
+        
+        if not self.parquet_storage.save_bars(bars, frequency):
+            logger.error(f"{frequency.value}数据保存失败")
+            return False
+        
+        logger.info(f"{frequency.value}数据保存成功: {len(bars)}条")
+        if states:
+            self._indicator_state.update(states)
+        return True
+    
+    def _dataframe_to_bars_incremental(self, df: pd.DataFrame, frequency: Frequency
+                                       ) -> Tuple[List[Bar], Dict[Tuple[str, str], IndicatorState]]:
+        """
+        增量计算技术指标并转换为Bar对象
+        
+        只处理不早于各股票上次处理时间的K线，指标由保存的滚动状态O(1)更新，
+        首次出现的股票从空状态开始累积。与上次最后一根K线时间相同的K线会替换其指标
+        （盘中获取的当日K线在收盘后得到修正）。
+        
+        计算在状态副本上进行，不修改已提交的状态。
+        
+        Returns:
+            (新增或修正的K线, 更新后的指标状态副本)
+        """
+        df = df.sort_values(['symbol', 'datetime'])
+        symbols = df['symbol'].tolist()
+        datetimes = pd.to_datetime(df['datetime']).tolist()
+        closes = df['close'].astype(np.float64).tolist()
+        
+        new_rows = []
+        values = {column: [] for column in IndicatorState.COLUMNS}
+        states: Dict[Tuple[str, str], IndicatorState] = {}
+        for i in range(len(symbols)):
+            key = (frequency.value, symbols[i])
+            state = states.get(key)
+            if state is None:
+                committed = self._indicator_state.get(key)
+                if committed is not None and datetimes[i] < committed.last_datetime:
+                    continue
+                # 首根需要处理的K线到达时才复制状态
+                state = states[key] = committed.copy() if committed is not None else IndicatorState()
+            elif datetimes[i] < state.last_datetime:
+                continue
+            
+            indicators = state.update(closes[i], datetimes[i])
+            new_rows.append(i)
+            for column in IndicatorState.COLUMNS:
+                values[column].append(indicators[column])
+        
+        new_df = df.iloc[new_rows].copy()
+        for column in IndicatorState.COLUMNS:
+            new_df[column] = values[column]
+        
+        return dataframe_to_bars(new_df, frequency), states
+    
+    def _load_indicator_state(self) -> Dict[Tuple[str, str], IndicatorState]:
+        """从磁盘加载指标状态，避免重启后重新计算"""
+        if not self._indicator_state_path.exists():
+            return {}
+        
+        try:
+            with open(self._indicator_state_path, 'rb') as f:
+                state = pickle.load(f)
+            logger.info(f"加载指标状态: {len(state)}个")
+            return state
+        except Exception as e:
+            logger.warning(f"加载指标状态失败，将重新计算: {e}")
+            return {}
+    
+    def _save_indicator_state(self):
+        """保存指标状态到磁盘（先写临时文件再替换，避免中断导致文件损坏）"""
+        try:
+            tmp_path = self._indicator_state_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._indicator_state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._indicator_state_path)
+        except Exception as e:
+            logger.error(f"保存指标状态失败: {e}", exc_info=True)
     
     def _dataframe_to_bars_with_indicators(self, df: pd.DataFrame, frequency: Frequency) -> List[Bar]:
         """将DataFrame转换为Bar对象并计算技术指标"""
-        bars = []
+        # 按股票分组并按时间排序
+        groups = [group for _, group in df.sort_values(['symbol', 'datetime']).groupby('symbol', sort=False)]
+        close_prices = [group['close'].to_numpy(dtype=np.float64) for group in groups]
         
-        # 按股票分组计算指标
-        for symbol, group in df.groupby('symbol'):
-            # 按时间排序
-            group = group.sort_values('datetime').copy()
-            
-            # 计算技术指标
-            close_prices = group['close']
-            
-            # 移动平均线
-            group['ma5'] = self.indicators.calculate_ma(close_prices, 5)
-            group['ma20'] = self.indicators.calculate_ma(close_prices, 20)
-            group['ma60'] = self.indicators.calculate_ma(close_prices, 60)
-            
-            # MACD
-            macd = self.indicators.calculate_macd(close_prices)
-            group['macd_dif'] = macd['dif']
-            group['macd_dea'] = macd['dea']
-            group['macd_histogram'] = macd['histogram']
-            
-            # RSI
-            group['rsi_14'] = self.indicators.calculate_rsi(close_prices, 14)
-            
-            # 布林带
-            boll = self.indicators.calculate_bollinger_bands(close_prices, 20)
-            group['boll_upper'] = boll['upper']
-            group['boll_lower'] = boll['lower']
-            
-            # 转换为Bar对象
-            for _, row in group.iterrows():
-                bar = Bar(
-                    symbol=row['symbol'],
-                    datetime=pd.to_datetime(row['datetime']),
-                    frequency=frequency,
-                    open=row['open'],
-                    high=row['high'],
-                    low=row['low'],
-                    close=row['close'],
-                    volume=row['volume'],
-                    amount=row['amount'],
-                    turnover=row.get('turnover', 0.0),
-                    ma5=row['ma5'] if pd.notna(row['ma5']) else None,
-                    ma20=row['ma20'] if pd.notna(row['ma20']) else None,
-                    ma60=row['ma60'] if pd.notna(row['ma60']) else None,
-                    macd_dif=row['macd_dif'] if pd.notna(row['macd_dif']) else None,
-                    macd_dea=row['macd_dea'] if pd.notna(row['macd_dea']) else None,
-                    macd_histogram=row['macd_histogram'] if pd.notna(row['macd_histogram']) else None,
-                    rsi_14=row['rsi_14'] if pd.notna(row['rsi_14']) else None,
-                    boll_upper=row['boll_upper'] if pd.notna(row['boll_upper']) else None,
-                    boll_lower=row['boll_lower'] if pd.notna(row['boll_lower']) else None,
-                )
-                bars.append(bar)
+        # 计算技术指标
+        results = [_compute_indicators(prices) for prices in close_prices]
+        
+        # 转换为Bar对象
+        bars = []
+        for group, indicators in zip(groups, results):
+            bars.extend(dataframe_to_bars(group.assign(**indicators), frequency))
         
         return bars
     
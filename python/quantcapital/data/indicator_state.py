@@ -0,0 +1,170 @@
+"""
+技术指标增量计算状态
+
+为每只股票保存滚动窗口和指数平均的中间状态，新K线到达时O(1)更新指标，
+无需对历史数据重新计算。计算口径与TechnicalIndicators一致，
+缺失（非有限）的收盘价按pandas口径跳过，不会污染后续指标。
+"""
+
+import copy
+import math
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class IndicatorState:
+    """单只股票的技术指标增量计算状态"""
+
+    # 输出的指标列，与Bar字段一致
+    COLUMNS = ('ma5', 'ma20', 'ma60', 'macd_dif', 'macd_dea', 'macd_histogram',
+               'rsi_14', 'boll_upper', 'boll_lower')
+
+    MA_WINDOWS = (5, 20, 60)
+    RSI_WINDOW = 14
+    BOLL_WINDOW = 20
+    BOLL_STD = 2.0
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+
+    def __init__(self):
+        self.last_datetime: Optional[datetime] = None
+
+        # 均线和布林带：最近60个收盘价及各窗口有效值的累加和、个数
+        self.closes = deque(maxlen=max(self.MA_WINDOWS))
+        self.sums = {window: 0.0 for window in self.MA_WINDOWS}
+        self.counts = {window: 0 for window in self.MA_WINDOWS}
+        self.boll_sum_sq = 0.0
+
+        # RSI：窗口内的涨跌幅及其累加和
+        self.prev_close: Optional[float] = None
+        self.gains = deque(maxlen=self.RSI_WINDOW)
+        self.losses = deque(maxlen=self.RSI_WINDOW)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+
+        # MACD：各EWM的加权和与权重和（adjust=True口径）
+        self.ewm = {span: [0.0, 0.0] for span in (self.MACD_FAST, self.MACD_SLOW, self.MACD_SIGNAL)}
+
+        # 最后一根K线加入前的状态快照，同一时间的K线再次到达时回退后重算
+        self._previous: Optional[tuple] = None
+
+    def copy(self) -> 'IndicatorState':
+        """返回独立副本，在副本上更新不影响当前状态"""
+        return copy.deepcopy(self)
+
+    def _snapshot(self) -> tuple:
+        """保存当前状态（不含快照本身）"""
+        return (self.last_datetime, self.closes.copy(), dict(self.sums), dict(self.counts), self.boll_sum_sq,
+                self.prev_close, self.gains.copy(), self.losses.copy(), self.gain_sum, self.loss_sum,
+                {span: list(state) for span, state in self.ewm.items()})
+
+    def _restore(self, snapshot: tuple):
+        """恢复到快照时的状态"""
+        (self.last_datetime, self.closes, self.sums, self.counts, self.boll_sum_sq,
+         self.prev_close, self.gains, self.losses, self.gain_sum, self.loss_sum,
+         self.ewm) = snapshot
+
+    def _update_ewm(self, span: int, value: float) -> float:
+        """
+        更新指定跨度的EWM并返回当前值
+
+        缺失值只衰减已有权重、不加入新观测（pandas ignore_na=False口径），
+        尚无有效观测时返回NaN。
+        """
+        decay = 1.0 - 2.0 / (span + 1.0)
+        state = self.ewm[span]
+        if math.isfinite(value):
+            state[0] = value + decay * state[0]
+            state[1] = 1.0 + decay * state[1]
+        else:
+            state[0] *= decay
+            state[1] *= decay
+        return state[0] / state[1] if state[1] > 0.0 else math.nan
+
+    def update(self, close: float, dt: datetime) -> Dict[str, Optional[float]]:
+        """
+        加入一根新K线并返回其技术指标
+
+        时间与最后一根K线相同时（如盘中获取的当日K线收盘后再次获取），
+        视为对最后一根K线的修正：先回退到其加入前的状态，再按新收盘价重算。
+
+        Args:
+            close: 收盘价
+            dt: K线时间
+
+        Returns:
+            指标名到数值的映射，无法计算的指标为None
+        """
+        if dt == self.last_datetime and self._previous is not None:
+            self._restore(self._previous)
+        self._previous = self._snapshot()
+
+        closes = self.closes
+        valid = math.isfinite(close)
+
+        # 只累加有效值；移出窗口的旧值在append前位于closes[-window]
+        count = len(closes)
+        for window in self.MA_WINDOWS:
+            if count >= window and math.isfinite(closes[-window]):
+                self.sums[window] -= closes[-window]
+                self.counts[window] -= 1
+                if window == self.BOLL_WINDOW:
+                    self.boll_sum_sq -= closes[-window] ** 2
+            if valid:
+                self.sums[window] += close
+                self.counts[window] += 1
+                if window == self.BOLL_WINDOW:
+                    self.boll_sum_sq += close * close
+            elif self.counts[window] == 0:
+                # 窗口内已无有效值，清除累计误差
+                self.sums[window] = 0.0
+                if window == self.BOLL_WINDOW:
+                    self.boll_sum_sq = 0.0
+        closes.append(close)
+
+        result = {}
+        for window in self.MA_WINDOWS:
+            n = self.counts[window]
+            result[f'ma{window}'] = self.sums[window] / n if n > 0 else None
+
+        # MACD
+        dif = self._update_ewm(self.MACD_FAST, close) - self._update_ewm(self.MACD_SLOW, close)
+        dea = self._update_ewm(self.MACD_SIGNAL, dif)
+        result['macd_dif'] = dif if math.isfinite(dif) else None
+        result['macd_dea'] = dea if math.isfinite(dea) else None
+        result['macd_histogram'] = (dif - dea) * 2 if math.isfinite(dif) and math.isfinite(dea) else None
+
+        # RSI：与缺失值相邻的涨跌幅按0计入窗口（pandas diff后where(delta > 0, 0)的口径）
+        prev_close = self.prev_close
+        if prev_close is None or not valid or not math.isfinite(prev_close):
+            delta = 0.0
+        else:
+            delta = close - prev_close
+        self.prev_close = close
+        if len(self.gains) == self.RSI_WINDOW:
+            self.gain_sum -= self.gains[0]
+            self.loss_sum -= self.losses[0]
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_sum += gain
+        self.loss_sum += loss
+        if self.loss_sum <= 0.0:
+            result['rsi_14'] = 100.0 if self.gain_sum > 0.0 else None
+        else:
+            result['rsi_14'] = 100.0 - 100.0 / (1.0 + self.gain_sum / self.loss_sum)
+
+        # 布林带（样本标准差）
+        boll_count = self.counts[self.BOLL_WINDOW]
+        if boll_count < 2:
+            result['boll_upper'] = None
+            result['boll_lower'] = None
+        else:
+            mean = result[f'ma{self.BOLL_WINDOW}']
+            var = (self.boll_sum_sq - self.sums[self.BOLL_WINDOW] * mean) / (boll_count - 1)
+            std = math.sqrt(var) if var > 0.0 else 0.0
+            result['boll_upper'] = mean + std * self.BOLL_STD
+            result['boll_lower'] = mean - std * self.BOLL_STD
+
+        self.last_datetime = dt
+        return result
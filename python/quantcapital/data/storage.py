@@ -10,15 +10,103 @@ import sqlite3
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
 from abc import ABC, abstractmethod
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from ..entities.bar import Bar, Frequency
 
 
 logger = logging.getLogger(__name__)
 
 
+# Bar中可为空的数值字段（NaN转换为None）
+_OPTIONAL_FLOAT_COLUMNS = (
+    'ma5', 'ma20', 'ma60', 'macd_dif', 'macd_dea', 'macd_histogram',
+    'rsi_14', 'boll_upper', 'boll_lower', 'market_cap', 'circulating_market_cap'
+)
+
+
+# 取值有界的振荡指标在Parquet中以float32存储；均线、MACD、布林带与价格同量级，
+# float32往返会引入噪声（如10.1读回为10.100000381），与价格、成交量一样保持float64
+_FLOAT32_COLUMNS = ('rsi_14',)
+
+
+def dataframe_to_bars(df: pd.DataFrame, frequency: Optional[Frequency] = None) -> List[Bar]:
+    """
+    将DataFrame转换为Bar对象列表
+    
+    每列只取一次数组，再按下标构建Bar，避免iterrows为每行创建Series。
+    
+    Args:
+        df: K线数据
+        frequency: K线频率，为None时读取frequency列
+        
+    Returns:
+        Bar对象列表
+    """
+    n = len(df)
+    if n == 0:
+        return []
+    
+    def column(name: str, default=None) -> list:
+        if name in df.columns:
+            return df[name].tolist()
+        return [default] * n
+    
+    def optional_column(name: str) -> list:
+        # NaN != NaN，借此将缺失值统一为None
+        return [None if v != v else v for v in column(name)]
+    
+    symbols = column('symbol')
+    datetimes = pd.to_datetime(df['datetime']).tolist()
+    if frequency is not None:
+        frequencies = [frequency] * n
+    else:
+        frequencies = [Frequency(v) for v in column('frequency')]
+    opens = column('open')
+    highs = column('high')
+    lows = column('low')
+    closes = column('close')
+    volumes = column('volume')
+    amounts = column('amount')
+    turnovers = [0.0 if v is None or v != v else v for v in column('turnover')]
+    optionals = {name: optional_column(name) for name in _OPTIONAL_FLOAT_COLUMNS}
+    is_st = column('is_st', False)
+    is_new_stock = column('is_new_stock', False)
+    
+    bars = []
+    for i in range(n):
+        bars.append(Bar(
+            symbol=symbols[i],
+            datetime=datetimes[i],
+            frequency=frequencies[i],
+            open=opens[i],
+            high=highs[i],
+            low=lows[i],
+            close=closes[i],
+            volume=volumes[i],
+            amount=amounts[i],
+            turnover=turnovers[i],
+            ma5=optionals['ma5'][i],
+            ma20=optionals['ma20'][i],
+            ma60=optionals['ma60'][i],
+            macd_dif=optionals['macd_dif'][i],
+            macd_dea=optionals['macd_dea'][i],
+            macd_histogram=optionals['macd_histogram'][i],
+            rsi_14=optionals['rsi_14'][i],
+            boll_upper=optionals['boll_upper'][i],
+            boll_lower=optionals['boll_lower'][i],
+            market_cap=optionals['market_cap'][i],
+            circulating_market_cap=optionals['circulating_market_cap'][i],
+            is_st=is_st[i],
+            is_new_stock=is_new_stock[i]
+        ))
+    return bars
+
+
 class Storage(ABC):
     """存储接口基类"""
     
@@ -29,8 +117,9 @@ class Storage(ABC):
     
     @abstractmethod
     def load_bars(self, symbols: List[str], start_date: datetime, 
-                  end_date: datetime, frequency: Frequency) -> pd.DataFrame:
-        """加载K线数据"""
+                  end_date: datetime, frequency: Frequency,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """加载K线数据（columns为None时返回全部列）"""
         pass
 
 
@@ -88,8 +177,9 @@ class ParquetStorage(Storage):
                         subset=['symbol', 'datetime'], keep='last'
                     ).sort_values(['symbol', 'datetime'])
                 
+                df = df.astype({col: 'float32' for col in _FLOAT32_COLUMNS if col in df.columns})
                 df.to_parquet(file_path, index=False, compression='snappy')
-                logger.debug(f"保存K线数据: {file_path}, {len(df)}条记录")
+                logger.debug("保存K线数据: %s, %d条记录", file_path, len(df))
             
             return True
             
@@ -97,42 +187,53 @@ class ParquetStorage(Storage):
             logger.error(f"保存K线数据失败: {e}", exc_info=True)
             return False
     
+    def load_table(self, symbols: List[str], start_date: datetime, 
+                   end_date: datetime, frequency: Frequency,
+                   columns: Optional[List[str]] = None) -> Optional[pa.Table]:
+        """
+        从Parquet文件加载K线数据为Arrow表
+        
+        股票和时间过滤条件下推到Parquet扫描，跳过不相关的row group；
+        指定columns时只读取所需列。结果保持列式存储，不构建pandas/Bar对象。
+        
+        Returns:
+            Arrow表（未排序），无数据时返回None
+        """
+        if columns is not None:
+            # 排序依赖symbol和datetime列
+            columns = ['symbol', 'datetime'] + [c for c in columns if c not in ('symbol', 'datetime')]
+        filters = (
+            pc.field('symbol').isin(symbols) &
+            (pc.field('datetime') >= pd.Timestamp(start_date)) &
+            (pc.field('datetime') <= pd.Timestamp(end_date))
+        )
+        
+        tables = []
+        for year in range(start_date.year, end_date.year + 1):
+            file_path = self._get_partition_path(frequency, year) / "data.parquet"
+            if file_path.exists():
+                tables.append(pq.read_table(file_path, columns=columns, filters=filters))
+        
+        if not tables:
+            logger.warning(f"未找到数据: symbols={symbols[:5]}{'...' if len(symbols)>5 else ''}, "
+                         f"时间范围={start_date.date()}-{end_date.date()}")
+            return None
+        
+        # 不同年份文件的列类型可能不同（如全空列），合并时自动提升
+        return pa.concat_tables(tables, promote_options='default')
+    
     def load_bars(self, symbols: List[str], start_date: datetime, 
-                  end_date: datetime, frequency: Frequency) -> pd.DataFrame:
+                  end_date: datetime, frequency: Frequency,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
         """从Parquet文件加载K线数据"""
         try:
-            dataframes = []
-            
-            # 确定需要读取的年份范围
-            start_year = start_date.year
-            end_year = end_date.year
-            
-            for year in range(start_year, end_year + 1):
-                partition_path = self._get_partition_path(frequency, year)
-                file_path = partition_path / "data.parquet"
-                
-                if file_path.exists():
-                    df = pd.read_parquet(file_path)
-                    dataframes.append(df)
-            
-            if not dataframes:
-                logger.warning(f"未找到数据: symbols={symbols[:5]}{'...' if len(symbols)>5 else ''}, "
-                             f"时间范围={start_date.date()}-{end_date.date()}")
+            table = self.load_table(symbols, start_date, end_date, frequency, columns)
+            if table is None:
                 return pd.DataFrame()
             
-            # 合并所有数据
-            df = pd.concat(dataframes, ignore_index=True)
+            result = table.to_pandas().sort_values(['symbol', 'datetime']).reset_index(drop=True)
             
-            # 过滤条件
-            df['datetime'] = pd.to_datetime(df['datetime'])
-            mask = (
-                (df['symbol'].isin(symbols)) &
-                (df['datetime'] >= start_date) &
-                (df['datetime'] <= end_date)
-            )
-            result = df[mask].sort_values(['symbol', 'datetime']).reset_index(drop=True)
-            
-            logger.debug(f"加载K线数据完成: {len(result)}条记录")
+            logger.debug("加载K线数据完成: %d条记录", len(result))
             return result
             
         except Exception as e:
@@ -235,22 +336,35 @@ class DuckDBStorage(Storage):
         """保存K线数据到DuckDB"""
         if not bars:
             return True
+        return self.save_dataframe(self._bars_to_dataframe(bars), frequency)
+    
+    def save_dataframe(self, data: Union[pd.DataFrame, pa.Table], frequency: Frequency) -> bool:
+        """
+        保存列式K线数据到DuckDB
+        
+        DataFrame/Arrow表直接注册为视图（零拷贝）后按列名插入，已存在的K线被替换，
+        无需先构建Bar对象。
+        
+        Args:
+            data: K线数据，缺少frequency列时使用frequency参数填充
+            frequency: K线频率
+        """
+        if len(data) == 0:
+            return True
         
         try:
-            df = self._bars_to_dataframe(bars)
             conn = self._get_connection()
+            has_frequency = 'frequency' in (data.column_names if isinstance(data, pa.Table) else data.columns)
+            select_sql = "SELECT * FROM temp_bars" if has_frequency else "SELECT *, ? AS frequency FROM temp_bars"
             
-            # 使用INSERT OR REPLACE语法
-            conn.execute("DELETE FROM kline_data WHERE symbol = ? AND datetime = ? AND frequency = ?",
-                        [(bar.symbol, bar.datetime, frequency.value) for bar in bars])
-            
-            conn.register('temp_bars', df)
-            conn.execute("""
-                INSERT INTO kline_data 
-                SELECT * FROM temp_bars
-            """)
+            conn.register('temp_bars', data)
+            try:
+                conn.execute(f"INSERT OR REPLACE INTO kline_data BY NAME {select_sql}",
+                             [] if has_frequency else [frequency.value])
+            finally:
+                conn.unregister('temp_bars')
             
-            logger.debug(f"保存K线数据到DuckDB: {len(bars)}条记录")
+            logger.debug("保存K线数据到DuckDB: %d条记录", len(data))
             return True
             
         except Exception as e:
@@ -258,15 +372,17 @@ class DuckDBStorage(Storage):
             return False
     
     def load_bars(self, symbols: List[str], start_date: datetime, 
-                  end_date: datetime, frequency: Frequency) -> pd.DataFrame:
+                  end_date: datetime, frequency: Frequency,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
         """从DuckDB加载K线数据"""
         try:
             conn = self._get_connection()
             
             # 构建SQL查询
             symbols_str = "','".join(symbols)
+            select_str = ', '.join(columns) if columns else '*'
             sql = f"""
-                SELECT * FROM kline_data 
+                SELECT {select_str} FROM kline_data 
                 WHERE symbol IN ('{symbols_str}')
                 AND datetime >= '{start_date}'
                 AND datetime <= '{end_date}'
@@ -275,7 +391,7 @@ class DuckDBStorage(Storage):
             """
             
             df = conn.execute(sql).fetchdf()
-            logger.debug(f"从DuckDB加载K线数据: {len(df)}条记录")
+            logger.debug("从DuckDB加载K线数据: %d条记录", len(df))
             return df
             
         except Exception as e:
@@ -313,6 +429,60 @@ class DuckDBStorage(Storage):
             })
         return pd.DataFrame(data)
     
+    def save_universe(self, universe_name: str, members: pd.DataFrame) -> bool:
+        """
+        保存股票池成员到DuckDB
+        
+        Args:
+            universe_name: 股票池名称
+            members: 成员数据，包含symbol和list_date（上市日期，可为空）列
+        """
+        try:
+            conn = self._get_connection()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS universe (
+                    name VARCHAR,
+                    symbol VARCHAR,
+                    list_date DATE
+                )
+            """)
+            conn.execute("DELETE FROM universe WHERE name = ?", [universe_name])
+            
+            conn.register('temp_universe', members)
+            try:
+                # 上市日期兼容 YYYY-MM-DD 与 YYYYMMDD 两种格式
+                conn.execute("""
+                    INSERT INTO universe
+                    SELECT ?, symbol,
+                           COALESCE(TRY_CAST(list_date AS DATE),
+                                    CAST(TRY_STRPTIME(list_date, '%Y%m%d') AS DATE))
+                    FROM temp_universe
+                """, [universe_name])
+            finally:
+                conn.unregister('temp_universe')
+            
+            logger.debug("保存股票池到DuckDB %s: %d支股票", universe_name, len(members))
+            return True
+            
+        except Exception as e:
+            logger.error(f"保存股票池到DuckDB失败: {e}", exc_info=True)
+            return False
+    
+    def load_universe(self, universe_name: str, date: datetime) -> List[str]:
+        """加载指定日期的股票池（排除该日期尚未上市的股票）"""
+        try:
+            conn = self._get_connection()
+            rows = conn.execute("""
+                SELECT symbol FROM universe
+                WHERE name = ? AND (list_date IS NULL OR list_date <= ?)
+                ORDER BY symbol
+            """, [universe_name, date.date()]).fetchall()
+            return [row[0] for row in rows]
+            
+        except Exception as e:
+            logger.error(f"从DuckDB加载股票池失败: {e}", exc_info=True)
+            return []
+    
     def close(self):
         """关闭数据库连接"""
         if self._connection:
@@ -398,13 +568,31 @@ class SQLiteBusinessStorage:
                     data
                 )
             
-            logger.debug(f"保存股票池 {universe_name}: {len(symbols)}支股票")
+            logger.debug("保存股票池 %s: %d支股票", universe_name, len(symbols))
             return True
             
         except Exception as e:
             logger.error(f"保存股票池失败: {e}", exc_info=True)
             return False
     
+    def load_universe_members(self, universe_name: str) -> pd.DataFrame:
+        """加载股票池成员及其上市日期（symbol, list_date）"""
+        try:
+            with self._get_connection() as conn:
+                members = pd.read_sql_query("""
+                    SELECT u.symbol, s.list_date
+                    FROM universe u LEFT JOIN stock_info s ON u.symbol = s.symbol
+                    WHERE u.name = ?
+                    ORDER BY u.symbol
+                """, conn, params=(universe_name,))
+            
+            logger.debug("加载股票池成员 %s: %d支股票", universe_name, len(members))
+            return members
+            
+        except Exception as e:
+            logger.error(f"加载股票池成员失败: {e}", exc_info=True)
+            return pd.DataFrame(columns=['symbol', 'list_date'])
+    
     def load_universe(self, universe_name: str) -> List[str]:
         """加载股票池"""
         try:
@@ -415,7 +603,7 @@ class SQLiteBusinessStorage:
                 )
                 symbols = [row[0] for row in cursor.fetchall()]
             
-            logger.debug(f"加载股票池 {universe_name}: {len(symbols)}支股票")
+            logger.debug("加载股票池 %s: %d支股票", universe_name, len(symbols))
             return symbols
             
         except Exception as e:
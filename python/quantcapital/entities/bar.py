@@ -17,9 +17,9 @@ class Frequency(Enum):
     WEEKLY = "W"     # 周线
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
-    """K线数据"""
+    """K线数据（使用__slots__，回测中大量实例化时显著降低内存占用）"""
     symbol: str                # 股票代码
     datetime: datetime         # 时间
     frequency: Frequency       # 频率
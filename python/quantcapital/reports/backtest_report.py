@@ -11,10 +11,14 @@
 
 import json
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
+import matplotlib
+matplotlib.use('Agg')  # 报告只输出图片文件，无需交互式后端
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -24,25 +28,247 @@ from matplotlib.dates import DateFormatter
 logger = logging.getLogger(__name__)
 
 
+def _init_plot_style():
+    """设置绘图字体和风格（主进程和绘图子进程共用）"""
+    # 设置中文字体
+    plt.rcParams['font.sans-serif'] = ['SimHei']
+    plt.rcParams['axes.unicode_minus'] = False
+    
+    # 长曲线渲染优化：丢弃亚像素顶点，分块绘制超长路径
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+    
+    # 设置风格
+    sns.set_style("whitegrid")
+
+
+def _to_equity_frame(equity_curve: Union[pd.DataFrame, Dict[str, np.ndarray], None]) -> Optional[pd.DataFrame]:
+    """
+    统一资金曲线格式
+    
+    回测引擎可直接传入预分配的数组 {'datetime': datetime64[], 'equity': float64[], 'benchmark': ...}，
+    此处包装为DataFrame而不复制数据。
+    """
+    if equity_curve is None or isinstance(equity_curve, pd.DataFrame):
+        return equity_curve
+    
+    columns = {k: v for k, v in equity_curve.items() if k != 'datetime'}
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(equity_curve['datetime']), copy=False)
+
+
+# 超过该点数的曲线在绘图前降采样（图宽约3600像素，更多的点不会带来可见差异）
+LTTB_THRESHOLD = 10_000
+LTTB_POINTS = 4_000
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 降采样
+    
+    保留首尾点，中间每个桶选取与前一选中点、下一桶均值点构成三角形面积最大的点，
+    在大幅减少点数的同时保持曲线形状（极值、回撤位置）。
+    
+    Args:
+        x: 横坐标（数值型）
+        y: 纵坐标
+        n_out: 输出点数
+        
+    Returns:
+        选中点的下标数组
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    
+    # 中间 n_out-2 个桶的边界
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return selected
+
+
+def _plot_points(equity_curve: pd.DataFrame, column: str):
+    """获取绘图用的坐标点，超长曲线使用LTTB降采样"""
+    values = equity_curve[column].to_numpy()
+    if len(values) <= LTTB_THRESHOLD:
+        return equity_curve.index, values
+    
+    x = equity_curve.index.values.astype('datetime64[ns]')
+    selected = _lttb(x.astype(np.int64), values, LTTB_POINTS)
+    return x[selected], values[selected]
+
+
+# 各图表相互独立且为CPU密集的PNG编码，定义为模块级函数以便提交到进程池
+def _plot_equity_curve(equity_curve: Optional[pd.DataFrame], report_dir: Path):
+    """绘制资金曲线"""
+    if equity_curve is None or equity_curve.empty:
+        return
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    # 绘制资金曲线
+    ax.plot(*_plot_points(equity_curve, 'equity'), 
+            label='资金曲线', linewidth=2)
+
+    # 添加基准线（如果有）
+    if 'benchmark' in equity_curve.columns:
+        ax.plot(*_plot_points(equity_curve, 'benchmark'),
+               label='基准', linewidth=1, alpha=0.7)
+
+    ax.set_xlabel('日期')
+    ax.set_ylabel('资金')
+    ax.set_title('策略资金曲线')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    # 格式化日期
+    ax.xaxis.set_major_formatter(DateFormatter('%Y-%m'))
+    plt.xticks(rotation=45)
+
+    plt.tight_layout()
+    plt.savefig(report_dir / 'equity_curve.png', dpi=300)
+    plt.close()
+
+
+def _plot_drawdown(equity_curve: Optional[pd.DataFrame], report_dir: Path):
+    """绘制回撤图"""
+    if equity_curve is None or equity_curve.empty or 'equity' not in equity_curve.columns:
+        return
+
+    # 计算回撤
+    equity = equity_curve['equity'].to_numpy(dtype=np.float64)
+    rolling_max = np.maximum.accumulate(equity)
+    drawdown = pd.Series((equity - rolling_max) / rolling_max, index=equity_curve.index)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    # 填充回撤区域
+    ax.fill_between(drawdown.index, 0, drawdown.values,
+                   color='red', alpha=0.3, label='回撤')
+    ax.plot(drawdown.index, drawdown.values,
+           color='red', linewidth=1)
+
+    ax.set_xlabel('日期')
+    ax.set_ylabel('回撤比例')
+    ax.set_title('策略回撤分析')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    # 格式化日期
+    ax.xaxis.set_major_formatter(DateFormatter('%Y-%m'))
+    plt.xticks(rotation=45)
+
+    # 显示最大回撤
+    max_dd = drawdown.min()
+    max_dd_date = drawdown.idxmin()
+    ax.annotate(f'最大回撤: {max_dd:.2%}',
+               xy=(max_dd_date, max_dd),
+               xytext=(max_dd_date, max_dd - 0.05),
+               arrowprops=dict(arrowstyle='->', color='red'))
+
+    plt.tight_layout()
+    plt.savefig(report_dir / 'drawdown.png', dpi=300)
+    plt.close()
+
+
+def _analyze_trades(trades: Optional[pd.DataFrame], report_dir: Path):
+    """分析交易记录"""
+    if trades is None or trades.empty:
+        return
+
+    # 交易盈亏分布
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+
+    # 盈亏分布直方图
+    profits = trades['profit']
+    ax1.hist(profits, bins=30, edgecolor='black', alpha=0.7)
+    ax1.axvline(x=0, color='red', linestyle='--', label='盈亏分界')
+    ax1.set_xlabel('盈亏金额')
+    ax1.set_ylabel('交易次数')
+    ax1.set_title('交易盈亏分布')
+    ax1.legend()
+
+    # 累计盈亏曲线
+    cumulative_profit = profits.cumsum()
+    ax2.plot(range(len(cumulative_profit)), cumulative_profit)
+    ax2.fill_between(range(len(cumulative_profit)), 0, cumulative_profit,
+                    where=cumulative_profit >= 0, color='green', alpha=0.3)
+    ax2.fill_between(range(len(cumulative_profit)), 0, cumulative_profit,
+                    where=cumulative_profit < 0, color='red', alpha=0.3)
+    ax2.set_xlabel('交易次数')
+    ax2.set_ylabel('累计盈亏')
+    ax2.set_title('累计盈亏曲线')
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(report_dir / 'trade_analysis.png', dpi=300)
+    plt.close()
+
+    # 保存交易记录
+    trades.to_csv(report_dir / 'trades.csv', index=False, encoding='utf-8')
+
+
+def _analyze_positions(positions: Optional[pd.DataFrame], report_dir: Path):
+    """分析持仓情况"""
+    if positions is None or positions.empty:
+        return
+
+    # 按股票统计持仓市值（factorize + bincount，跳过groupby的排序和哈希索引构建）
+    # 代码缺失的行factorize编码为-1，与groupby一致跳过
+    codes, symbols = pd.factorize(positions['symbol'], sort=False)
+    if len(symbols) == 0:
+        return
+    market_values = positions['market_value'].to_numpy(dtype=np.float64)
+    mask = codes >= 0
+    totals = np.bincount(codes[mask], weights=market_values[mask], minlength=len(symbols))
+    top = np.argsort(-totals)[:10]
+
+    # 持仓分布饼图
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.pie(totals[top], labels=symbols[top],
+          autopct='%1.1f%%', startangle=90)
+    ax.set_title('持仓分布（前10）')
+
+    plt.tight_layout()
+    plt.savefig(report_dir / 'position_distribution.png', dpi=300)
+    plt.close()
+
+
 class BacktestReport:
     """回测报告生成器"""
     
-    def __init__(self, output_dir: str = "./reports"):
+    def __init__(self, output_dir: str = "./reports", max_workers: int = 1):
         """
         初始化报告生成器
         
         Args:
             output_dir: 报告输出目录
+            max_workers: 并行绘图进程数，默认1即在当前进程顺序绘制；
+                图表数量少时进程启动和重新导入matplotlib的开销通常超过收益，需要时显式开启
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
         
-        # 设置中文字体
-        plt.rcParams['font.sans-serif'] = ['SimHei']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 设置风格
-        sns.set_style("whitegrid")
+        _init_plot_style()
         
     def generate_report(self, 
                        backtest_result: Dict,
@@ -65,16 +291,20 @@ class BacktestReport:
             
             # 解析回测数据
             summary = backtest_result.get('summary', {})
-            equity_curve = backtest_result.get('equity_curve', pd.DataFrame())
-            trades = backtest_result.get('trades', pd.DataFrame())
-            positions = backtest_result.get('positions', pd.DataFrame())
+            equity_curve = _to_equity_frame(backtest_result.get('equity_curve'))
+            trades = backtest_result.get('trades')
+            positions = backtest_result.get('positions')
             
-            # 生成各部分报告
+            # 生成各部分图表
+            self._render_sections([
+                (_plot_equity_curve, equity_curve),
+                (_plot_drawdown, equity_curve),
+                (_analyze_trades, trades),
+                (_analyze_positions, positions),
+            ], report_dir)
+            
+            # 生成业绩摘要
             self._generate_summary_report(summary, report_dir)
-            self._plot_equity_curve(equity_curve, report_dir)
-            self._plot_drawdown(equity_curve, report_dir)
-            self._analyze_trades(trades, report_dir)
-            self._analyze_positions(positions, report_dir)
             
             # 生成HTML总报告
             html_path = self._generate_html_report(
@@ -88,6 +318,22 @@ class BacktestReport:
             logger.error(f"生成回测报告失败: {e}")
             raise
             
+    def _render_sections(self, sections: List, report_dir: Path):
+        """绘制各图表（默认顺序绘制；max_workers>1时使用进程池，matplotlib非线程安全）"""
+        if self.max_workers <= 1:
+            for plot_fn, data in sections:
+                plot_fn(data, report_dir)
+            return
+        
+        # 使用spawn启动子进程，避免fork复制日志QueueListener等后台线程的状态
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(sections)),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_plot_style) as executor:
+            futures = [executor.submit(plot_fn, data, report_dir)
+                       for plot_fn, data in sections]
+            for future in futures:
+                future.result()
+            
     def _generate_summary_report(self, summary: Dict, report_dir: Path):
         """生成业绩摘要"""
         # 保存JSON格式
@@ -118,132 +364,6 @@ class BacktestReport:
             f.write(f"盈利次数: {summary.get('winning_trades', 0)}\n")
             f.write(f"亏损次数: {summary.get('losing_trades', 0)}\n")
             
-    def _plot_equity_curve(self, equity_curve: pd.DataFrame, report_dir: Path):
-        """绘制资金曲线"""
-        if equity_curve.empty:
-            return
-            
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # 绘制资金曲线
-        ax.plot(equity_curve.index, equity_curve['equity'], 
-                label='资金曲线', linewidth=2)
-        
-        # 添加基准线（如果有）
-        if 'benchmark' in equity_curve.columns:
-            ax.plot(equity_curve.index, equity_curve['benchmark'],
-                   label='基准', linewidth=1, alpha=0.7)
-                   
-        ax.set_xlabel('日期')
-        ax.set_ylabel('资金')
-        ax.set_title('策略资金曲线')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        # 格式化日期
-        ax.xaxis.set_major_formatter(DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        plt.savefig(report_dir / 'equity_curve.png', dpi=300)
-        plt.close()
-        
-    def _plot_drawdown(self, equity_curve: pd.DataFrame, report_dir: Path):
-        """绘制回撤图"""
-        if equity_curve.empty or 'equity' not in equity_curve.columns:
-            return
-            
-        # 计算回撤
-        rolling_max = equity_curve['equity'].expanding().max()
-        drawdown = (equity_curve['equity'] - rolling_max) / rolling_max
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # 填充回撤区域
-        ax.fill_between(drawdown.index, 0, drawdown.values,
-                       color='red', alpha=0.3, label='回撤')
-        ax.plot(drawdown.index, drawdown.values,
-               color='red', linewidth=1)
-               
-        ax.set_xlabel('日期')
-        ax.set_ylabel('回撤比例')
-        ax.set_title('策略回撤分析')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        # 格式化日期
-        ax.xaxis.set_major_formatter(DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
-        
-        # 显示最大回撤
-        max_dd = drawdown.min()
-        max_dd_date = drawdown.idxmin()
-        ax.annotate(f'最大回撤: {max_dd:.2%}',
-                   xy=(max_dd_date, max_dd),
-                   xytext=(max_dd_date, max_dd - 0.05),
-                   arrowprops=dict(arrowstyle='->', color='red'))
-                   
-        plt.tight_layout()
-        plt.savefig(report_dir / 'drawdown.png', dpi=300)
-        plt.close()
-        
-    def _analyze_trades(self, trades: pd.DataFrame, report_dir: Path):
-        """分析交易记录"""
-        if trades.empty:
-            return
-            
-        # 交易盈亏分布
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-        
-        # 盈亏分布直方图
-        profits = trades['profit']
-        ax1.hist(profits, bins=30, edgecolor='black', alpha=0.7)
-        ax1.axvline(x=0, color='red', linestyle='--', label='盈亏分界')
-        ax1.set_xlabel('盈亏金额')
-        ax1.set_ylabel('交易次数')
-        ax1.set_title('交易盈亏分布')
-        ax1.legend()
-        
-        # 累计盈亏曲线
-        cumulative_profit = profits.cumsum()
-        ax2.plot(range(len(cumulative_profit)), cumulative_profit)
-        ax2.fill_between(range(len(cumulative_profit)), 0, cumulative_profit,
-                        where=cumulative_profit >= 0, color='green', alpha=0.3)
-        ax2.fill_between(range(len(cumulative_profit)), 0, cumulative_profit,
-                        where=cumulative_profit < 0, color='red', alpha=0.3)
-        ax2.set_xlabel('交易次数')
-        ax2.set_ylabel('累计盈亏')
-        ax2.set_title('累计盈亏曲线')
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(report_dir / 'trade_analysis.png', dpi=300)
-        plt.close()
-        
-        # 保存交易记录
-        trades.to_csv(report_dir / 'trades.csv', index=False, encoding='utf-8')
-        
-    def _analyze_positions(self, positions: pd.DataFrame, report_dir: Path):
-        """分析持仓情况"""
-        if positions.empty:
-            return
-            
-        # 持仓分布饼图
-        fig, ax = plt.subplots(figsize=(8, 8))
-        
-        # 按股票统计持仓市值
-        position_values = positions.groupby('symbol')['market_value'].sum()
-        position_values = position_values.sort_values(ascending=False).head(10)
-        
-        # 绘制饼图
-        ax.pie(position_values.values, labels=position_values.index,
-              autopct='%1.1f%%', startangle=90)
-        ax.set_title('持仓分布（前10）')
-        
-        plt.tight_layout()
-        plt.savefig(report_dir / 'position_distribution.png', dpi=300)
-        plt.close()
-        
     def _generate_html_report(self, 
                             strategy_name: str,
                             summary: Dict,
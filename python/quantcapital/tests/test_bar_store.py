@@ -0,0 +1,76 @@
+"""
+列式K线存储单元测试
+
+测试按时间定位、构建Bar及转换DataFrame，以及共享列数组不会被调用方修改。
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta
+from quantcapital.data.bar_store import build_soa_store
+from quantcapital.entities.bar import Frequency
+
+
+@pytest.fixture
+def store():
+    """两只股票各5根日K线（乱序输入）"""
+    rows = []
+    for symbol, base in (('000002.SZ', 20.0), ('000001.SZ', 10.0)):
+        for i in range(5):
+            close = base + i
+            rows.append({
+                'symbol': symbol, 'datetime': datetime(2024, 1, 1) + timedelta(days=i),
+                'open': close, 'high': close + 0.5, 'low': close - 0.5, 'close': close,
+                'volume': 1000 * (i + 1), 'amount': close * 1000 * (i + 1),
+                'ma5': np.nan if i < 4 else base + 2.0,
+            })
+    return build_soa_store(pd.DataFrame(rows[::-1]))
+
+
+class TestSoABars:
+    """列式K线存储测试"""
+
+    def test_locate(self, store):
+        """测试时间范围定位为闭区间，超出范围时返回空区间"""
+        soa = store['000001.SZ']
+        assert soa.locate(datetime(2024, 1, 2), datetime(2024, 1, 4)) == (1, 4)
+        assert soa.locate(datetime(2023, 12, 1), datetime(2024, 2, 1)) == (0, 5)
+        i, j = soa.locate(datetime(2024, 2, 1), datetime(2024, 3, 1))
+        assert i == j
+
+    def test_latest_index(self, store):
+        """测试不晚于指定时间的最后一根K线下标"""
+        soa = store['000001.SZ']
+        assert soa.latest_index(datetime(2024, 1, 3)) == 2
+        assert soa.latest_index(datetime(2024, 1, 3, 15)) == 2
+        assert soa.latest_index(datetime(2023, 12, 31)) == -1
+
+    def test_bar_at(self, store):
+        """测试从列数组构建Bar，NaN指标转换为None"""
+        soa = store['000001.SZ']
+        bar = soa.bar_at(0, Frequency.DAILY)
+        assert bar.symbol == '000001.SZ'
+        assert bar.datetime == datetime(2024, 1, 1)
+        assert bar.close == 10.0
+        assert bar.volume == 1000
+        assert bar.ma5 is None
+        assert soa.bar_at(4, Frequency.DAILY).ma5 == 12.0
+
+    def test_to_frame(self, store):
+        """测试转换DataFrame，修改返回结果不影响存储"""
+        soa = store['000002.SZ']
+        df = soa.to_frame(1, 3, ['close', 'volume'])
+        assert list(df.columns) == ['symbol', 'datetime', 'close', 'volume']
+        assert df['close'].tolist() == [21.0, 22.0]
+
+        df.loc[0, 'close'] = 0.0
+        assert soa.columns['close'][1] == 21.0
+
+    def test_columns_read_only(self, store):
+        """测试共享列数组为只读"""
+        soa = store['000001.SZ']
+        with pytest.raises(ValueError):
+            soa.columns['close'][0] = 0.0
+        with pytest.raises(ValueError):
+            soa.datetime[0] = np.datetime64('2000-01-01')
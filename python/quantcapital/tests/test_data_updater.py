@@ -0,0 +1,76 @@
+"""
+数据更新器单元测试
+
+测试增量指标状态只在K线保存成功后提交，以及同一时间K线的修正。
+"""
+
+import pandas as pd
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from quantcapital.data.data_updater import DataUpdater
+from quantcapital.entities.bar import Frequency
+
+
+def make_kline_df(closes, start=datetime(2024, 1, 1), symbol='000001.SZ'):
+    """构造数据源返回格式的日K线"""
+    return pd.DataFrame({
+        'symbol': symbol,
+        'datetime': [start + timedelta(days=i) for i in range(len(closes))],
+        'open': closes,
+        'high': [c + 0.1 for c in closes],
+        'low': [c - 0.1 for c in closes],
+        'close': closes,
+        'volume': 1000.0,
+        'amount': [c * 1000 for c in closes],
+    })
+
+
+@pytest.fixture
+def updater(tmp_path):
+    """只启用增量指标路径的数据更新器"""
+    updater = DataUpdater.__new__(DataUpdater)
+    updater.incremental_indicators = True
+    updater.parquet_storage = Mock()
+    updater.parquet_storage.save_bars.return_value = True
+    updater._indicator_state = {}
+    updater._indicator_state_path = tmp_path / 'indicator_state.pkl'
+    return updater
+
+
+class TestIncrementalIndicators:
+    """增量指标计算测试"""
+
+    def test_state_committed_only_after_save(self, updater):
+        """测试保存失败时状态不提交，重试时重新计算同一批K线"""
+        df = make_kline_df([10.0, 10.5, 11.0])
+        key = (Frequency.DAILY.value, '000001.SZ')
+
+        bars, states = updater._dataframe_to_bars_incremental(df, Frequency.DAILY)
+        assert len(bars) == 3
+        assert updater._indicator_state == {}
+
+        updater.parquet_storage.save_bars.return_value = False
+        assert not updater._save_frequency_bars(bars, Frequency.DAILY, states)
+        assert updater._indicator_state == {}
+
+        updater.parquet_storage.save_bars.return_value = True
+        bars, states = updater._dataframe_to_bars_incremental(df, Frequency.DAILY)
+        assert len(bars) == 3
+        assert updater._save_frequency_bars(bars, Frequency.DAILY, states)
+        assert updater._indicator_state[key].last_datetime == datetime(2024, 1, 3)
+
+    def test_same_datetime_bar_corrected(self, updater):
+        """测试重新获取的最后一根K线替换原指标，早于它的K线被跳过"""
+        bars, states = updater._dataframe_to_bars_incremental(make_kline_df([10.0, 11.0, 12.0]), Frequency.DAILY)
+        updater._save_frequency_bars(bars, Frequency.DAILY, states)
+
+        # 收盘后重新获取，最后一根K线收盘价被修正
+        bars, states = updater._dataframe_to_bars_incremental(make_kline_df([10.0, 11.0, 9.0]), Frequency.DAILY)
+        assert [bar.datetime for bar in bars] == [datetime(2024, 1, 3)]
+        assert bars[0].ma5 == pytest.approx(10.0)
+        updater._save_frequency_bars(bars, Frequency.DAILY, states)
+
+        bars, _ = updater._dataframe_to_bars_incremental(make_kline_df([10.0, 11.0, 9.0, 10.0]), Frequency.DAILY)
+        assert [bar.datetime for bar in bars] == [datetime(2024, 1, 3), datetime(2024, 1, 4)]
+        assert bars[-1].ma5 == pytest.approx(10.0)
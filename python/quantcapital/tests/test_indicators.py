@@ -0,0 +1,159 @@
+"""
+技术指标单元测试
+
+验证numba指标内核及增量指标状态与pandas rolling/ewm口径一致。
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from quantcapital.data._indicator_njit import ma_njit, macd_njit, rsi_njit, bbands_njit
+from quantcapital.data.indicator_state import IndicatorState
+
+
+@pytest.fixture
+def close_prices():
+    """随机游走收盘价，包含连续平盘区间以覆盖RSI无涨跌的情况"""
+    rng = np.random.default_rng(42)
+    prices = 10.0 + np.cumsum(rng.normal(0, 0.2, 200))
+    prices[50:70] = prices[50]
+    return prices
+
+
+def pandas_indicators(prices: np.ndarray) -> dict:
+    """pandas参考实现"""
+    close = pd.Series(prices)
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14, min_periods=1).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14, min_periods=1).mean()
+    dif = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    dea = dif.ewm(span=9).mean()
+    ma20 = close.rolling(window=20, min_periods=1).mean()
+    std20 = close.rolling(window=20, min_periods=1).std()
+    return {
+        'ma5': close.rolling(window=5, min_periods=1).mean(),
+        'ma20': ma20,
+        'ma60': close.rolling(window=60, min_periods=1).mean(),
+        'macd_dif': dif,
+        'macd_dea': dea,
+        'macd_histogram': (dif - dea) * 2,
+        'rsi_14': 100 - 100 / (1 + gain / loss),
+        'boll_upper': ma20 + std20 * 2,
+        'boll_lower': ma20 - std20 * 2,
+    }
+
+
+class TestIndicatorKernels:
+    """numba指标内核测试"""
+
+    def test_ma(self, close_prices):
+        """测试移动平均线"""
+        expected = pandas_indicators(close_prices)
+        for window in (5, 20, 60):
+            np.testing.assert_allclose(ma_njit(close_prices, window), expected[f'ma{window}'])
+
+    def test_macd(self, close_prices):
+        """测试MACD"""
+        expected = pandas_indicators(close_prices)
+        dif, dea, histogram = macd_njit(close_prices, 12, 26, 9)
+        np.testing.assert_allclose(dif, expected['macd_dif'], atol=1e-10)
+        np.testing.assert_allclose(dea, expected['macd_dea'], atol=1e-10)
+        np.testing.assert_allclose(histogram, expected['macd_histogram'], atol=1e-10)
+
+    def test_rsi(self, close_prices):
+        """测试RSI（包含窗口内无涨跌的平盘区间）"""
+        expected = pandas_indicators(close_prices)
+        np.testing.assert_allclose(rsi_njit(close_prices, 14), expected['rsi_14'], atol=1e-8)
+
+    def test_bollinger_bands(self, close_prices):
+        """测试布林带（首根K线样本标准差无定义）"""
+        expected = pandas_indicators(close_prices)
+        upper, middle, lower = bbands_njit(close_prices, 20, 2.0)
+        np.testing.assert_allclose(middle, expected['ma20'])
+        np.testing.assert_allclose(upper, expected['boll_upper'], atol=1e-8)
+        np.testing.assert_allclose(lower, expected['boll_lower'], atol=1e-8)
+
+    def test_missing_values(self, close_prices):
+        """测试缺失值（停牌等）只影响包含它的窗口，与pandas一致"""
+        np.testing.assert_allclose(ma_njit(np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0]), 3),
+                                   [1.0, 1.5, 1.5, 3.0, 4.5, 5.0])
+
+        prices = close_prices.copy()
+        prices[[0, 1, 30, 31, 32, 120]] = np.nan
+        expected = pandas_indicators(prices)
+        for window in (5, 20, 60):
+            np.testing.assert_allclose(ma_njit(prices, window), expected[f'ma{window}'])
+        dif, dea, histogram = macd_njit(prices, 12, 26, 9)
+        np.testing.assert_allclose(dif, expected['macd_dif'], atol=1e-10)
+        np.testing.assert_allclose(dea, expected['macd_dea'], atol=1e-10)
+        np.testing.assert_allclose(histogram, expected['macd_histogram'], atol=1e-10)
+        np.testing.assert_allclose(rsi_njit(prices, 14), expected['rsi_14'], atol=1e-8)
+        upper, middle, lower = bbands_njit(prices, 20, 2.0)
+        np.testing.assert_allclose(middle, expected['ma20'])
+        np.testing.assert_allclose(upper, expected['boll_upper'], atol=1e-8)
+        np.testing.assert_allclose(lower, expected['boll_lower'], atol=1e-8)
+        assert np.isfinite(ma_njit(prices, 60)[-1])
+
+
+def feed(state: IndicatorState, prices: np.ndarray, start: datetime) -> list:
+    """逐根加入K线，返回每根K线的指标"""
+    return [state.update(float(price), start + timedelta(days=i)) for i, price in enumerate(prices)]
+
+
+def assert_matches_pandas(results: list, prices: np.ndarray):
+    """增量结果与pandas在整个序列上的计算结果一致（None对应NaN）"""
+    expected = pandas_indicators(prices)
+    for column in IndicatorState.COLUMNS:
+        actual = np.array([np.nan if r[column] is None else r[column] for r in results])
+        np.testing.assert_allclose(actual, expected[column], atol=1e-8, err_msg=column)
+
+
+class TestIndicatorState:
+    """增量指标状态测试"""
+
+    def test_matches_pandas(self, close_prices):
+        """测试逐根更新与pandas全量计算一致"""
+        results = feed(IndicatorState(), close_prices, datetime(2024, 1, 1))
+        assert_matches_pandas(results, close_prices)
+
+    def test_missing_close_does_not_poison_state(self):
+        """测试缺失收盘价只影响包含它的窗口，移出窗口后指标恢复"""
+        prices = np.array([10.0, 11.0, np.nan] + [12.0] * 70)
+        results = feed(IndicatorState(), prices, datetime(2024, 1, 1))
+        assert_matches_pandas(results, prices)
+        assert all(results[-1][column] is not None for column in IndicatorState.COLUMNS if column != 'rsi_14')
+
+    def test_same_datetime_replaces_last_bar(self, close_prices):
+        """测试同一时间的K线再次到达时替换最后一根K线"""
+        start = datetime(2024, 1, 1)
+        state = IndicatorState()
+        results = feed(state, close_prices, start)
+
+        # 盘中获取的最后一根K线收盘后被修正（可多次修正）
+        corrected = close_prices.copy()
+        last_dt = start + timedelta(days=len(close_prices) - 1)
+        state.update(float(close_prices[-1]) + 1.0, last_dt)
+        corrected[-1] = close_prices[-1] - 0.5
+        results[-1] = state.update(float(corrected[-1]), last_dt)
+        assert_matches_pandas(results, corrected)
+
+        # 修正后继续追加新K线
+        extended = np.append(corrected, corrected[-1] + 0.3)
+        results.append(state.update(float(extended[-1]), last_dt + timedelta(days=1)))
+        assert_matches_pandas(results, extended)
+
+    def test_copy_is_independent(self, close_prices):
+        """测试在副本上更新不影响原状态"""
+        start = datetime(2024, 1, 1)
+        state = IndicatorState()
+        feed(state, close_prices[:100], start)
+
+        pending = state.copy()
+        pending.update(float(close_prices[100]), start + timedelta(days=100))
+        assert state.last_datetime == start + timedelta(days=99)
+
+        results = feed(IndicatorState(), close_prices[:100], start)
+        results.extend(feed(state, close_prices[100:], start + timedelta(days=100)))
+        assert_matches_pandas(results, close_prices)
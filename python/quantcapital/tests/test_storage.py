@@ -0,0 +1,34 @@
+"""
+存储组件单元测试
+
+测试Parquet存储的列类型：价格量级的指标往返后保持原值。
+"""
+
+import pyarrow.parquet as pq
+from datetime import datetime
+from quantcapital.data.storage import ParquetStorage
+from quantcapital.entities.bar import Bar, Frequency
+
+
+class TestParquetStorage:
+    """Parquet存储测试"""
+
+    def test_price_scale_indicators_round_trip(self, tmp_path):
+        """测试均线、MACD、布林带以float64保存，读回与写入值相同"""
+        storage = ParquetStorage(str(tmp_path))
+        bar = Bar(
+            symbol='000001.SZ', datetime=datetime(2024, 1, 2), frequency=Frequency.DAILY,
+            open=10.1, high=10.3, low=10.0, close=10.2, volume=123456789, amount=1.26e9,
+            ma5=10.1, ma20=10.13, ma60=9.87, macd_dif=0.031, macd_dea=0.027, macd_histogram=0.008,
+            rsi_14=55.5, boll_upper=10.61, boll_lower=9.65
+        )
+        assert storage.save_bars([bar], Frequency.DAILY)
+
+        df = storage.load_bars(['000001.SZ'], datetime(2024, 1, 1), datetime(2024, 1, 3), Frequency.DAILY)
+        for column in ('ma5', 'ma20', 'ma60', 'macd_dif', 'macd_dea', 'macd_histogram',
+                       'boll_upper', 'boll_lower', 'volume'):
+            assert df[column].iloc[0] == getattr(bar, column), column
+
+        schema = pq.read_schema(tmp_path / 'kline' / 'frequency=D' / 'year=2024' / 'data.parquet')
+        assert str(schema.field('rsi_14').type) == 'float'
+        assert str(schema.field('ma5').type) == 'double'
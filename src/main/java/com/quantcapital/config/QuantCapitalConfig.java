@@ -105,6 +105,9 @@ public class QuantCapitalConfig {
         /** 默认仓位大小 */
         private double defaultPositionSize = 10000.0;
         
+        /** 重复信号冷却时间（秒），同一策略对同一标的的同向信号在此时间内只处理一次，0表示不过滤 */
+        private long signalCooldownSeconds = 0;
+        
         /** 风控参数 */
         private RiskConfig risk = new RiskConfig();
     }
@@ -17,6 +17,7 @@ import java.sql.SQLException;
 import java.sql.Statement;
 import java.time.LocalDate;
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
@@ -266,7 +267,7 @@ public class ParquetDataHandler implements DataHandler {
             ResultSet rs = stmt.executeQuery(sql);
             
             while (rs.next()) {
-                symbols.add(rs.getString("symbol"));
+                symbols.add(rs.getString("symbol").intern());
             }
         } catch (SQLException e) {
             log.error("获取股票列表失败", e);
@@ -383,13 +384,28 @@ public class ParquetDataHandler implements DataHandler {
     
     /**
      * 按日期范围过滤K线数据
+     * 缓存的K线按时间升序排列，二分定位区间后返回只读子列表视图，不逐根复制
      */
     private List<Bar> filterBarsByDateRange(List<Bar> bars, LocalDate startDate, LocalDate endDate) {
-        return bars.stream()
-            .filter(bar -> {
-                LocalDate barDate = bar.getDatetime().toLocalDate();
-                return !barDate.isBefore(startDate) && !barDate.isAfter(endDate);
-            })
-            .toList();
+        int from = lowerBound(bars, startDate);
+        int to = lowerBound(bars, endDate.plusDays(1));
+        return from < to ? Collections.unmodifiableList(bars.subList(from, to)) : Collections.emptyList();
+    }
+    
+    /**
+     * 查找第一根日期不早于指定日期的K线下标
+     */
+    private static int lowerBound(List<Bar> bars, LocalDate date) {
+        int low = 0;
+        int high = bars.size();
+        while (low < high) {
+            int mid = (low + high) >>> 1;
+            if (bars.get(mid).getDatetime().toLocalDate().isBefore(date)) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
     }
 }
\ No newline at end of file
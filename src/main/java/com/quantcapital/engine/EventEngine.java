@@ -1,10 +1,12 @@
 package com.quantcapital.engine;
 
+import com.quantcapital.entities.constant.EventType;
 import com.quantcapital.entities.event.Event;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Value;
 import org.springframework.stereotype.Component;
 
+import java.util.Arrays;
 import java.util.List;
 import java.util.Map;
 import java.util.concurrent.CompletableFuture;
@@ -13,7 +15,7 @@ import java.util.concurrent.CopyOnWriteArrayList;
 import java.util.concurrent.PriorityBlockingQueue;
 import java.util.concurrent.TimeUnit;
 import java.util.concurrent.atomic.AtomicBoolean;
-import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.LongAdder;
 
 /**
  * 高性能事件驱动引擎
@@ -47,6 +49,11 @@ public class EventEngine {
     // 事件订阅者映射 - 每个事件类型对应多个订阅者
     private final Map<String, List<EventSubscriber>> subscribers = new ConcurrentHashMap<>();
 
+    private static final EventSubscriber[] NO_SUBSCRIBERS = new EventSubscriber[0];
+
+    // 分发用订阅者数组快照 - 按EventType序号索引，仅在注册/注销时整体替换，分发时无需哈希查找
+    private volatile EventSubscriber[][] dispatchTable = newDispatchTable();
+
     // 事件分发线程
     private Thread dispatcherThread;
 
@@ -54,9 +61,11 @@ public class EventEngine {
     private final AtomicBoolean running = new AtomicBoolean(false);
 
     // 统计信息
-    private final AtomicLong totalEvents = new AtomicLong(0);
-    private final AtomicLong dispatchedEvents = new AtomicLong(0);
-    private final AtomicLong droppedEvents = new AtomicLong(0);
+    // 发布侧计数由多个线程写入，使用分段累加的LongAdder避免CAS竞争
+    private final LongAdder totalEvents = new LongAdder();
+    private final LongAdder droppedEvents = new LongAdder();
+    // 分发计数只由分发线程写入，volatile保证读取可见性即可，无需原子指令
+    private volatile long dispatchedEvents = 0;
 
     // 性能监控
     private volatile long lastStatsTime = System.currentTimeMillis();
@@ -131,7 +140,7 @@ public class EventEngine {
     public boolean publishEvent(Event event) {
         if (!running.get()) {
             log.warn("事件引擎未运行，事件被丢弃: {}", event);
-            droppedEvents.incrementAndGet();
+            droppedEvents.increment();
             return false;
         }
 
@@ -144,7 +153,7 @@ public class EventEngine {
         if (mainEventQueue.size() >= queueCapacity * 0.9) {
             if (event.getPriority() > 5) {
                 log.warn("主队列接近满载，丢弃低优先级事件: {}", event);
-                droppedEvents.incrementAndGet();
+                droppedEvents.increment();
                 return false;
             }
         }
@@ -152,20 +161,71 @@ public class EventEngine {
         try {
             boolean offered = mainEventQueue.offer(event);
             if (offered) {
-                totalEvents.incrementAndGet();
-                log.debug("事件已发布到主队列: {}", event);
+                totalEvents.increment();
+                if (log.isDebugEnabled()) {
+                    log.debug("事件已发布到主队列: {}", event);
+                }
             } else {
                 log.warn("主队列已满，事件被丢弃: {}", event);
-                droppedEvents.incrementAndGet();
+                droppedEvents.increment();
             }
             return offered;
         } catch (Exception e) {
             log.error("发布事件失败: {}", event, e);
-            droppedEvents.incrementAndGet();
+            droppedEvents.increment();
             return false;
         }
     }
 
+    /**
+     * 批量发布事件 - 运行状态和队列水位只检查一次，统计计数一次性累加
+     * <p>
+     * 适用于一次产生多个事件的场景（如一根K线触发多个信号），
+     * 丢弃规则与publishEvent一致：队列接近满载时丢弃低优先级事件。
+     *
+     * @param events 事件列表
+     * @return 成功发布的事件数
+     */
+    public int publishEvents(List<? extends Event> events) {
+        if (events == null || events.isEmpty()) {
+            return 0;
+        }
+
+        if (!running.get()) {
+            log.warn("事件引擎未运行，{} 个事件被丢弃", events.size());
+            droppedEvents.add(events.size());
+            return 0;
+        }
+
+        boolean nearlyFull = mainEventQueue.size() + events.size() >= queueCapacity * 0.9;
+        int published = 0;
+        int dropped = 0;
+        for (Event event : events) {
+            if (event == null) {
+                continue;
+            }
+            if (nearlyFull && event.getPriority() > 5) {
+                dropped++;
+                continue;
+            }
+            if (mainEventQueue.offer(event)) {
+                published++;
+            } else {
+                dropped++;
+            }
+        }
+
+        totalEvents.add(published);
+        if (dropped > 0) {
+            droppedEvents.add(dropped);
+            log.warn("主队列接近满载，批量发布中丢弃 {} 个事件", dropped);
+        }
+        if (log.isDebugEnabled()) {
+            log.debug("批量发布事件到主队列: {}/{}", published, events.size());
+        }
+        return published;
+    }
+
     /**
      * 注册事件处理器 - 为每个处理器创建独立的订阅者
      *
@@ -192,6 +252,7 @@ public class EventEngine {
                 new EventSubscriber(eventType + "-" + handler.getName(), handler, queueCapacity / 10);
 
         subscribers.computeIfAbsent(eventType, k -> new CopyOnWriteArrayList<>()).add(subscriber);
+        refreshDispatchTable(eventType);
 
         log.info("注册事件处理器: {} -> {}", eventType, handler.getName());
     }
@@ -218,7 +279,36 @@ public class EventEngine {
                 }
                 return false;
             });
+            refreshDispatchTable(eventType);
+        }
+    }
+
+    /**
+     * 重建指定事件类型的分发快照
+     *
+     * @param eventType 事件类型
+     */
+    private synchronized void refreshDispatchTable(String eventType) {
+        EventType type;
+        try {
+            type = EventType.valueOf(eventType);
+        } catch (IllegalArgumentException e) {
+            log.warn("未知的事件类型，不会收到任何事件: {}", eventType);
+            return;
         }
+
+        List<EventSubscriber> subscriberList = subscribers.get(eventType);
+        EventSubscriber[][] table = dispatchTable.clone();
+        table[type.ordinal()] = subscriberList == null || subscriberList.isEmpty()
+                ? NO_SUBSCRIBERS
+                : subscriberList.toArray(NO_SUBSCRIBERS);
+        dispatchTable = table;
+    }
+
+    private static EventSubscriber[][] newDispatchTable() {
+        EventSubscriber[][] table = new EventSubscriber[EventType.values().length][];
+        Arrays.fill(table, NO_SUBSCRIBERS);
+        return table;
     }
 
     /**
@@ -250,28 +340,33 @@ public class EventEngine {
      * @param event 事件对象
      */
     private void dispatchEvent(Event event) {
-        String eventType = event.getType().name();
-        List<EventSubscriber> subscriberList = subscribers.get(eventType);
+        EventSubscriber[] targets = dispatchTable[event.getType().ordinal()];
 
-        if (subscriberList == null || subscriberList.isEmpty()) {
-            log.debug("没有找到事件订阅者: {}", eventType);
+        if (targets.length == 0) {
+            if (log.isDebugEnabled()) {
+                log.debug("没有找到事件订阅者: {}", event.getType());
+            }
             return;
         }
 
-        log.debug("分发事件: {} 给 {} 个订阅者", event, subscriberList.size());
+        // 分发热路径：关闭debug时避免参数装箱和varargs数组分配
+        if (log.isDebugEnabled()) {
+            log.debug("分发事件: {} 给 {} 个订阅者", event, targets.length);
+        }
 
-        // 并行分发到所有订阅者的独立队列
-        int successCount = 0;
-        for (EventSubscriber subscriber : subscriberList) {
-            if (subscriber.offerEvent(event)) {
-                successCount++;
+        // 分发到所有订阅者的独立队列，只统计失败数
+        int failedCount = 0;
+        for (EventSubscriber subscriber : targets) {
+            if (!subscriber.offerEvent(event)) {
+                failedCount++;
             }
         }
 
-        dispatchedEvents.incrementAndGet();
+        dispatchedEvents++;
 
-        if (successCount < subscriberList.size()) {
-            log.warn("事件 {} 只成功分发给 {}/{} 个订阅者", event.getEventId(), successCount, subscriberList.size());
+        if (failedCount > 0) {
+            log.warn("事件 {} 只成功分发给 {}/{} 个订阅者", event.getEventId(), targets.length - failedCount,
+                    targets.length);
         }
     }
 
@@ -285,15 +380,15 @@ public class EventEngine {
 
                 long currentTime = System.currentTimeMillis();
                 long timeElapsed = currentTime - lastStatsTime;
-                long currentDispatched = dispatchedEvents.get();
+                long currentDispatched = dispatchedEvents;
 
                 if (timeElapsed > 0) {
                     eventsPerSecond = (double) currentDispatched * 1000 / timeElapsed;
                 }
 
                 log.debug("事件引擎性能: 分发速度:{:.2f}事件/秒 主队列大小:{} 总事件:{} 已分发:{} 丢弃:{}",
-                        eventsPerSecond, mainEventQueue.size(), totalEvents.get(), dispatchedEvents.get(),
-                        droppedEvents.get());
+                        eventsPerSecond, mainEventQueue.size(), totalEvents.sum(), dispatchedEvents,
+                        droppedEvents.sum());
 
                 lastStatsTime = currentTime;
 
@@ -311,9 +406,9 @@ public class EventEngine {
      */
     private void printStatistics() {
         log.info("事件引擎统计信息:");
-        log.info("  总事件数: {}", totalEvents.get());
-        log.info("  已分发: {}", dispatchedEvents.get());
-        log.info("  丢弃: {}", droppedEvents.get());
+        log.info("  总事件数: {}", totalEvents.sum());
+        log.info("  已分发: {}", dispatchedEvents);
+        log.info("  丢弃: {}", droppedEvents.sum());
         log.info("  平均分发速度: {:.2f} 事件/秒", eventsPerSecond);
         log.info("  主队列剩余: {}", mainEventQueue.size());
 
@@ -349,9 +444,9 @@ public class EventEngine {
         Map<String, Object> stats = new ConcurrentHashMap<>();
         stats.put("running", running.get());
         stats.put("mainQueueSize", getMainQueueSize());
-        stats.put("totalEvents", totalEvents.get());
-        stats.put("dispatchedEvents", dispatchedEvents.get());
-        stats.put("droppedEvents", droppedEvents.get());
+        stats.put("totalEvents", totalEvents.sum());
+        stats.put("dispatchedEvents", dispatchedEvents);
+        stats.put("droppedEvents", droppedEvents.sum());
         stats.put("eventsPerSecond", eventsPerSecond);
 
         // 添加订阅者统计信息
@@ -10,32 +10,45 @@ import com.quantcapital.entities.event.Event;
 import lombok.Getter;
 import lombok.extern.slf4j.Slf4j;
 
+import java.lang.invoke.VarHandle;
 import java.util.Map;
-import java.util.concurrent.BlockingQueue;
-import java.util.concurrent.LinkedBlockingQueue;
-import java.util.concurrent.TimeUnit;
 import java.util.concurrent.atomic.AtomicBoolean;
-import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.locks.LockSupport;
 
 /**
  * 事件订阅者 - 每个订阅者拥有独立的队列和处理线程
+ * <p>
+ * 队列只有分发线程写入、处理线程读取，使用SPSC无锁环形缓冲区；
+ * 空闲时处理线程先自旋再park，由分发线程写入后唤醒。
+ * <p>
+ * 唤醒握手：分发线程写入队列 -> 全屏障 -> 读waiting；处理线程写waiting -> 全屏障 -> 检查队列。
+ * 两侧都是"先写后读"，全屏障保证至少一方看到另一方的写入，
+ * 因此不会出现处理线程已park而分发线程未唤醒的情况，park无需超时兜底。
  * @author lijiechengbj
  */
 @Slf4j
 public class EventSubscriber {
+    // 空闲自旋次数，超过后park等待
+    private static final int SPIN_TRIES = 100;
+    // 持续丢弃/失败时的日志采样间隔：首次及每N次记录一次完整日志
+    private static final long LOG_SAMPLE_INTERVAL = 1000;
+
     private final String name;
     @Getter
     private final EventHandler handler;
-    private final BlockingQueue<Event> eventQueue;
+    private final SpscRingBuffer<Event> eventQueue;
     private final Thread processingThread;
+    private volatile boolean waiting = false;
     private final AtomicBoolean active = new AtomicBoolean(true);
-    private final AtomicLong processedCount = new AtomicLong(0);
-    private final AtomicLong failedCount = new AtomicLong(0);
+    // 计数器各自只有一个写线程（处理线程/分发线程），volatile保证读取可见性即可
+    private volatile long processedCount = 0;
+    private volatile long failedCount = 0;
+    private volatile long droppedCount = 0;
 
     public EventSubscriber(String name, EventHandler handler, int queueCapacity) {
         this.name = name;
         this.handler = handler;
-        this.eventQueue = new LinkedBlockingQueue<>(queueCapacity);
+        this.eventQueue = new SpscRingBuffer<>(queueCapacity);
 
         // 创建独立的处理线程
         this.processingThread = Thread.ofVirtual()
@@ -52,23 +65,43 @@ public class EventSubscriber {
 
         boolean offered = eventQueue.offer(event);
         if (!offered) {
-            log.warn("订阅者 {} 队列已满，丢弃事件: {}", name, event);
+            long dropped = ++droppedCount;
+            if (isSampled(dropped)) {
+                log.warn("订阅者 {} 队列已满，丢弃事件: {} (累计丢弃{})", name, event, dropped);
+            }
+            return false;
+        }
+
+        // 入队的release写与读取waiting之间需要全屏障，与处理线程的park前检查配对
+        VarHandle.fullFence();
+        if (waiting) {
+            LockSupport.unpark(processingThread);
         }
-        return offered;
+        return true;
     }
 
     private void processEvents() {
         log.info("订阅者 {} 处理线程启动", name);
 
+        int idleCount = 0;
         while (active.get() || !eventQueue.isEmpty()) {
             try {
-                Event event = eventQueue.poll(100, TimeUnit.MILLISECONDS);
+                Event event = eventQueue.poll();
                 if (event != null) {
+                    idleCount = 0;
                     processEvent(event);
+                } else if (++idleCount < SPIN_TRIES) {
+                    Thread.onSpinWait();
+                } else {
+                    waiting = true;
+                    // 写waiting与检查队列之间需要全屏障，与分发线程的入队后检查配对
+                    VarHandle.fullFence();
+                    if (eventQueue.isEmpty() && active.get()) {
+                        // 由入队唤醒，停止时由shutdown中断唤醒；虚假唤醒时循环重新检查
+                        LockSupport.park(this);
+                    }
+                    waiting = false;
                 }
-            } catch (InterruptedException e) {
-                Thread.currentThread().interrupt();
-                break;
             } catch (Exception e) {
                 log.error("订阅者 {} 处理事件异常", name, e);
             }
@@ -83,18 +116,27 @@ public class EventSubscriber {
             handler.handleEvent(event);
             long duration = System.nanoTime() - startTime;
 
-            processedCount.incrementAndGet();
+            processedCount++;
 
             if (duration > 5_000_000_000L) { // 5秒超时警告
                 log.warn("订阅者 {} 处理事件超时: {}ms", name, duration / 1_000_000);
             }
 
         } catch (Exception e) {
-            log.error("订阅者 {} 处理事件失败: {}", name, event, e);
-            failedCount.incrementAndGet();
+            // 只对采样的失败记录完整堆栈，其余仅记录异常摘要
+            long failed = ++failedCount;
+            if (isSampled(failed)) {
+                log.error("订阅者 {} 处理事件失败: {} (累计失败{})", name, event, failed, e);
+            } else {
+                log.error("订阅者 {} 处理事件失败: {}", name, e.toString());
+            }
         }
     }
 
+    private static boolean isSampled(long count) {
+        return count == 1 || count % LOG_SAMPLE_INTERVAL == 0;
+    }
+
     public void shutdown() {
         active.set(false);
         if (processingThread != null && processingThread.isAlive()) {
@@ -112,8 +154,9 @@ public class EventSubscriber {
                 "name", name,
                 "active", active.get(),
                 "queueSize", eventQueue.size(),
-                "processedCount", processedCount.get(),
-                "failedCount", failedCount.get()
+                "processedCount", processedCount,
+                "failedCount", failedCount,
+                "droppedCount", droppedCount
         );
     }
 }
\ No newline at end of file
@@ -0,0 +1,101 @@
+package com.quantcapital.engine;
+
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * 单生产者单消费者无锁环形缓冲区
+ * <p>
+ * 设计要点：
+ * 1. 容量向上取整为2的幂，下标通过位运算取模
+ * 2. 生产者只写tail、消费者只写head，无需加锁和CAS
+ * 3. 通过release/acquire语义发布槽位，保证消费者读到完整写入的元素
+ * 4. 各自缓存对方的游标，减少跨核读取
+ * <p>
+ * 仅允许一个线程调用offer、一个线程调用poll，size/isEmpty可在任意线程调用（近似值）。
+ *
+ * @author QuantCapital Team
+ */
+public class SpscRingBuffer<E> {
+
+    private final Object[] buffer;
+    private final int mask;
+
+    // 消费者读取位置
+    private final AtomicLong head = new AtomicLong(0);
+    // 生产者写入位置
+    private final AtomicLong tail = new AtomicLong(0);
+
+    // 生产者缓存的head，消费者缓存的tail
+    private long cachedHead = 0;
+    private long cachedTail = 0;
+
+    public SpscRingBuffer(int capacity) {
+        if (capacity <= 0) {
+            throw new IllegalArgumentException("容量必须为正数: " + capacity);
+        }
+        int size = Integer.highestOneBit(capacity);
+        if (size < capacity) {
+            size <<= 1;
+        }
+        this.buffer = new Object[size];
+        this.mask = size - 1;
+    }
+
+    /**
+     * 写入元素（仅生产者线程调用）
+     *
+     * @return 缓冲区已满时返回false
+     */
+    public boolean offer(E element) {
+        if (element == null) {
+            throw new NullPointerException("不支持null元素");
+        }
+
+        long currentTail = tail.get();
+        if (currentTail - cachedHead >= buffer.length) {
+            cachedHead = head.getAcquire();
+            if (currentTail - cachedHead >= buffer.length) {
+                return false;
+            }
+        }
+
+        buffer[(int) currentTail & mask] = element;
+        tail.setRelease(currentTail + 1);
+        return true;
+    }
+
+    /**
+     * 读取元素（仅消费者线程调用）
+     *
+     * @return 缓冲区为空时返回null
+     */
+    @SuppressWarnings("unchecked")
+    public E poll() {
+        long currentHead = head.get();
+        if (currentHead >= cachedTail) {
+            cachedTail = tail.getAcquire();
+            if (currentHead >= cachedTail) {
+                return null;
+            }
+        }
+
+        int index = (int) currentHead & mask;
+        E element = (E) buffer[index];
+        buffer[index] = null;
+        head.setRelease(currentHead + 1);
+        return element;
+    }
+
+    public int size() {
+        long size = tail.getAcquire() - head.getAcquire();
+        return (int) Math.max(0, Math.min(size, buffer.length));
+    }
+
+    public boolean isEmpty() {
+        return tail.getAcquire() == head.getAcquire();
+    }
+
+    public int capacity() {
+        return buffer.length;
+    }
+}
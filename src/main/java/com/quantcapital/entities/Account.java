@@ -302,10 +302,16 @@ public class Account {
         double cashChange = fill.getNetAmount();
         cash += cashChange;
         
-        // 解冻对应的资金
+        // 解冻对应的资金：按下单时的冻结口径（委托价含1%费用预留）释放本次成交部分，
+        // 各笔成交数量之和等于委托数量，全部成交后冻结资金恰好释放完毕
         if (fill.getSide() == OrderSide.BUY) {
-            double frozenAmount = fill.getAmount() + fill.getTotalFee();
-            unfreezeCash(frozenAmount);
+            String orderId = fill.getOrderId();
+            Order order = orderId != null ? orders.get(orderId) : null;
+            if (order != null) {
+                unfreezeCash(requiredCash(fill.getQuantity(), order.getPrice()));
+            } else {
+                unfreezeCash(fill.getAmount() + fill.getTotalFee());
+            }
         }
     }
     
@@ -319,13 +325,23 @@ public class Account {
         
         // 如果是买单，冻结资金
         if (order.isBuyOrder()) {
-            double requiredAmount = order.getQuantity() * order.getPrice() * 1.01; // 预留1%的费用空间
-            freezeCash(requiredAmount, order.getOrderId());
+            freezeCash(requiredCash(order.getQuantity(), order.getPrice()), order.getOrderId());
         }
         
         lastUpdateTime = LocalDateTime.now();
     }
     
+    /**
+     * 计算买入所需冻结的资金
+     * 
+     * @param quantity 数量
+     * @param price 价格
+     * @return 冻结金额（预留1%的费用空间）
+     */
+    private static double requiredCash(int quantity, double price) {
+        return quantity * price * 1.01;
+    }
+    
     /**
      * 计算账户总市值
      * 
@@ -433,11 +449,15 @@ public class Account {
         stats.put("frozenCash", frozenCash);
         stats.put("availableCash", getAvailableCash());
         
-        double totalMarketValue = getTotalMarketValue(currentPrices);
-        double totalUnrealizedPnl = getTotalUnrealizedPnl(currentPrices);
-        double totalPnl = getTotalPnl(currentPrices);
-        double returnRate = getReturnRate(currentPrices);
-        double capitalUtilization = getCapitalUtilization(currentPrices);
+        // 一次遍历持仓得到各项汇总，避免各统计方法分别遍历
+        PositionTotals totals = sumPositions(currentPrices);
+        double totalMarketValue = cash + totals.marketValue;
+        double totalUnrealizedPnl = totals.unrealizedPnl;
+        double totalPnl = totalRealizedPnl + totalUnrealizedPnl;
+        double returnRate = initialCapital == 0 ? 0.0
+                : ((totalMarketValue - initialCapital) / initialCapital) * 100;
+        double capitalUtilization = initialCapital == 0 ? 0.0
+                : (totals.absMarketValue / initialCapital) * 100;
         
         stats.put("totalMarketValue", totalMarketValue);
         stats.put("totalRealizedPnl", totalRealizedPnl);
@@ -460,6 +480,41 @@ public class Account {
         return stats;
     }
     
+    /**
+     * 持仓汇总值
+     */
+    private static class PositionTotals {
+        /** 持仓市值（有价格用当前价，否则用成本价） */
+        private double marketValue;
+        /** 持仓市值绝对值之和 */
+        private double absMarketValue;
+        /** 未实现盈亏（仅统计有价格的持仓） */
+        private double unrealizedPnl;
+    }
+    
+    /**
+     * 单次遍历汇总所有持仓的市值和未实现盈亏
+     * 
+     * @param currentPrices 当前价格信息
+     * @return 持仓汇总值
+     */
+    private PositionTotals sumPositions(Map<String, Double> currentPrices) {
+        PositionTotals totals = new PositionTotals();
+        for (Position position : positions.values()) {
+            Double currentPrice = currentPrices.get(position.getSymbol());
+            double marketValue;
+            if (currentPrice != null) {
+                marketValue = position.getCurrentMarketValue(currentPrice);
+                totals.unrealizedPnl += position.getUnrealizedPnl(currentPrice);
+            } else {
+                marketValue = position.getMarketValue();
+            }
+            totals.marketValue += marketValue;
+            totals.absMarketValue += Math.abs(marketValue);
+        }
+        return totals;
+    }
+    
     /**
      * 获取持仓统计
      * 
@@ -11,7 +11,7 @@ import lombok.Data;
 import lombok.NoArgsConstructor;
 
 import java.time.LocalDateTime;
-import java.util.UUID;
+import java.util.concurrent.atomic.AtomicLong;
 
 /**
  * 订单实体
@@ -27,6 +27,12 @@ import java.util.UUID;
 @AllArgsConstructor
 public class Order {
     
+    /** 订单ID前缀（进程启动时间戳），与自增序号组合保证进程内唯一 */
+    private static final String ORDER_ID_PREFIX = System.currentTimeMillis() / 1000 + "-";
+    
+    /** 订单ID自增序号 */
+    private static final AtomicLong ORDER_SEQUENCE = new AtomicLong(0);
+    
     /** 订单ID，全局唯一 */
     private String orderId;
     
@@ -113,7 +119,7 @@ public class Order {
      */
     public Order(String symbol, OrderType orderType, OrderSide side, 
                  int quantity, double price, String strategyId) {
-        this.orderId = UUID.randomUUID().toString();
+        this.orderId = nextOrderId();
         this.symbol = symbol;
         this.orderType = orderType;
         this.side = side;
@@ -122,7 +128,7 @@ public class Order {
         this.strategyId = strategyId;
         this.status = OrderStatus.PENDING;
         this.createdTime = LocalDateTime.now();
-        this.lastUpdateTime = LocalDateTime.now();
+        this.lastUpdateTime = this.createdTime;
         this.filledQuantity = 0;
         this.remainingQuantity = quantity;
         this.avgFillPrice = 0.0;
@@ -130,6 +136,17 @@ public class Order {
         this.timeInForce = TimeInForce.DAY; // 默认当日有效
     }
     
+    /**
+     * 生成订单ID
+     * <p>
+     * 使用"启动时间戳-序号"代替随机UUID，生成开销小且回测中可复现。
+     * 
+     * @return 订单ID
+     */
+    public static String nextOrderId() {
+        return ORDER_ID_PREFIX + ORDER_SEQUENCE.incrementAndGet();
+    }
+    
     /**
      * 更新订单状态
      * 
@@ -140,7 +157,7 @@ public class Order {
         this.lastUpdateTime = LocalDateTime.now();
         
         if (newStatus == OrderStatus.SUBMITTED) {
-            this.submittedTime = LocalDateTime.now();
+            this.submittedTime = this.lastUpdateTime;
         }
     }
     
@@ -155,23 +172,15 @@ public class Order {
             return;
         }
         
-        // 更新成交统计
-        double fillAmount = fillQuantity * fillPrice;
-        this.totalFillAmount += fillAmount;
-        this.filledQuantity += fillQuantity;
-        this.remainingQuantity = Math.max(0, this.quantity - this.filledQuantity);
-        
-        // 计算平均成交价格
-        if (this.filledQuantity > 0) {
-            this.avgFillPrice = this.totalFillAmount / this.filledQuantity;
-        }
+        // 更新成交统计（fillQuantity已校验为正，累计成交数量必然大于0）
+        int filled = this.filledQuantity + fillQuantity;
+        this.filledQuantity = filled;
+        this.totalFillAmount += fillQuantity * fillPrice;
+        this.avgFillPrice = this.totalFillAmount / filled;
+        this.remainingQuantity = Math.max(0, this.quantity - filled);
         
         // 更新订单状态
-        if (this.remainingQuantity == 0) {
-            updateStatus(OrderStatus.FILLED);
-        } else if (this.filledQuantity > 0) {
-            updateStatus(OrderStatus.PARTIALLY_FILLED);
-        }
+        updateStatus(this.remainingQuantity == 0 ? OrderStatus.FILLED : OrderStatus.PARTIALLY_FILLED);
     }
     
     /**
@@ -150,23 +150,17 @@ public class Position {
             return;
         }
         
-        int newQuantity = this.quantity + quantityChange;
+        int oldQuantity = this.quantity;
+        int newQuantity = oldQuantity + quantityChange;
         
-        // 如果方向相同（加仓），计算新的平均成本价
-        if ((this.quantity >= 0 && quantityChange > 0) || (this.quantity <= 0 && quantityChange < 0)) {
-            if (newQuantity != 0) {
-                double totalCost = (this.quantity * this.avgPrice) + (quantityChange * fillPrice);
-                this.avgPrice = Math.abs(totalCost / newQuantity);
-            }
-        } 
-        // 如果是减仓，成本价保持不变
-        else if (Math.abs(quantityChange) <= Math.abs(this.quantity)) {
-            // 减仓，成本价不变
-        }
-        // 如果是反向开仓（超过原持仓数量），使用新价格
-        else if (newQuantity * this.quantity < 0) {
+        if (oldQuantity == 0 || (oldQuantity > 0) == (quantityChange > 0)) {
+            // 开仓或加仓（方向相同），按加权平均计算成本价；quantityChange非0，newQuantity不会为0
+            this.avgPrice = Math.abs((oldQuantity * this.avgPrice + quantityChange * fillPrice) / newQuantity);
+        } else if ((long) newQuantity * oldQuantity < 0) {
+            // 反向开仓（超过原持仓数量），使用新价格
             this.avgPrice = fillPrice;
         }
+        // 其余为减仓或平仓，成本价保持不变
         
         this.quantity = newQuantity;
         this.lastUpdateTime = java.time.LocalDateTime.now();
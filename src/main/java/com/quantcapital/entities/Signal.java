@@ -9,7 +9,7 @@ import lombok.Data;
 import lombok.NoArgsConstructor;
 
 import java.time.LocalDateTime;
-import java.util.UUID;
+import java.util.concurrent.atomic.AtomicLong;
 
 /**
  * 交易信号实体
@@ -25,6 +25,12 @@ import java.util.UUID;
 @AllArgsConstructor
 public class Signal {
     
+    /** 信号ID前缀（进程启动时间戳），与自增序号组合保证进程内唯一 */
+    private static final String SIGNAL_ID_PREFIX = "S" + System.currentTimeMillis() / 1000 + "-";
+    
+    /** 信号ID自增序号 */
+    private static final AtomicLong SIGNAL_SEQUENCE = new AtomicLong(0);
+    
     /** 信号ID，全局唯一 */
     private String signalId;
     
@@ -66,11 +72,11 @@ public class Signal {
     private Double takeProfitPrice;
     
     /**
-     * 默认构造函数，生成UUID作为信号ID
+     * 默认构造函数，生成进程内唯一的信号ID
      */
     public Signal(String strategyId, String symbol, SignalDirection direction, 
                   double strength, LocalDateTime timestamp, double referencePrice, String reason) {
-        this.signalId = UUID.randomUUID().toString();
+        this.signalId = SIGNAL_ID_PREFIX + SIGNAL_SEQUENCE.incrementAndGet();
         this.strategyId = strategyId;
         this.symbol = symbol;
         this.direction = direction;
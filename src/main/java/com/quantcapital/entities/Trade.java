@@ -1,6 +1,7 @@
 package com.quantcapital.entities;
 
 import com.fasterxml.jackson.annotation.JsonFormat;
+import com.quantcapital.entities.constant.OrderSide;
 import com.quantcapital.entities.constant.TradeStatus;
 import lombok.AllArgsConstructor;
 import lombok.Builder;
@@ -49,7 +50,7 @@ public class Trade {
     private int openQuantity;
     
     /** 开仓方向（买入/卖出） */
-    private String openSide;
+    private OrderSide openSide;
     
     // ==================== 平仓信息 ====================
     
@@ -67,7 +68,7 @@ public class Trade {
     private Integer closeQuantity;
     
     /** 平仓方向（买入/卖出） */
-    private String closeSide;
+    private OrderSide closeSide;
     
     // ==================== 交易结果 ====================
     
@@ -104,7 +105,7 @@ public class Trade {
         this.openTime = openFill.getTimestamp();
         this.openPrice = openFill.getPrice();
         this.openQuantity = openFill.getQuantity();
-        this.openSide = openFill.getSide().toString();
+        this.openSide = openFill.getSide();
         this.status = TradeStatus.OPEN;
         this.totalCommission = openFill.getTotalFee();
         this.realizedPnl = 0.0;
@@ -124,15 +125,8 @@ public class Trade {
             throw new IllegalArgumentException("平仓标的与开仓标的不匹配");
         }
         
-        // 检查平仓方向是否正确
-        boolean isValidClose = false;
-        if (openSide.equals("BUY") && closeFill.getSide().toString().equals("SELL")) {
-            isValidClose = true;
-        } else if (openSide.equals("SELL") && closeFill.getSide().toString().equals("BUY")) {
-            isValidClose = true;
-        }
-        
-        if (!isValidClose) {
+        // 检查平仓方向是否正确（平仓方向须与开仓方向相反）
+        if (closeFill.getSide() == openSide) {
             throw new IllegalArgumentException("平仓方向错误");
         }
         
@@ -140,7 +134,7 @@ public class Trade {
         this.closeTime = closeFill.getTimestamp();
         this.closePrice = closeFill.getPrice();
         this.closeQuantity = closeFill.getQuantity();
-        this.closeSide = closeFill.getSide().toString();
+        this.closeSide = closeFill.getSide();
         this.totalCommission += closeFill.getTotalFee();
         
         // 计算持续时间
@@ -168,7 +162,7 @@ public class Trade {
         int actualQuantity = Math.min(openQuantity, closeQuantity);
         
         // 根据开仓方向计算盈亏
-        if (openSide.equals("BUY")) {
+        if (openSide == OrderSide.BUY) {
             // 买入开仓，卖出平仓
             this.realizedPnl = (closePrice - openPrice) * actualQuantity - totalCommission;
         } else {
@@ -216,7 +210,7 @@ public class Trade {
      * @return 交易方向（多头/空头）
      */
     public String getTradeDirection() {
-        return openSide.equals("BUY") ? "多头" : "空头";
+        return openSide == OrderSide.BUY ? "多头" : "空头";
     }
     
     /**
@@ -175,10 +175,15 @@ public class Universe {
      * @return 是否包含
      */
     public boolean contains(String symbol) {
-        if (symbol == null || symbol.trim().isEmpty()) {
+        if (symbol == null) {
             return false;
         }
-        return symbols.contains(symbol.trim().toUpperCase());
+        // 池内代码已规范化，命中时无需再trim/toUpperCase生成新字符串
+        if (symbols.contains(symbol)) {
+            return true;
+        }
+        String cleanSymbol = symbol.trim();
+        return !cleanSymbol.isEmpty() && symbols.contains(cleanSymbol.toUpperCase());
     }
     
     /**
@@ -193,12 +198,12 @@ public class Universe {
     }
     
     /**
-     * 获取股票集合（副本）
+     * 获取股票集合（只读视图，不复制）
      * 
      * @return 股票代码集合
      */
     public Set<String> getSymbolsSet() {
-        return new HashSet<>(symbols);
+        return Collections.unmodifiableSet(symbols);
     }
     
     /**
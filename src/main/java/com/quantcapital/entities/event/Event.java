@@ -10,7 +10,7 @@ import lombok.NoArgsConstructor;
 
 import java.time.LocalDateTime;
 import java.util.Map;
-import java.util.UUID;
+import java.util.concurrent.atomic.AtomicLong;
 
 /**
  * 事件基类
@@ -31,6 +31,16 @@ import java.util.UUID;
         @JsonSubTypes.Type(value = TimerEvent.class, name = "TIMER")})
 public abstract class Event {
 
+    /**
+     * 事件ID前缀（进程启动时间戳），与自增序号组合保证进程内唯一
+     */
+    private static final String EVENT_ID_PREFIX = "E" + System.currentTimeMillis() / 1000 + "-";
+
+    /**
+     * 事件ID自增序号
+     */
+    private static final AtomicLong EVENT_SEQUENCE = new AtomicLong(0);
+
     /**
      * 事件ID，全局唯一
      */
@@ -69,7 +79,7 @@ public abstract class Event {
      * @param timestamp 事件时间
      */
     protected Event(EventType type, LocalDateTime timestamp) {
-        this.eventId = UUID.randomUUID().toString();
+        this.eventId = EVENT_ID_PREFIX + EVENT_SEQUENCE.incrementAndGet();
         this.type = type;
         this.timestamp = timestamp;
     }
@@ -145,8 +145,10 @@ public class SimulatedExecutionHandler extends ExecutionHandler {
             // 处理成交
             processOrderFill(order, fillQuantity, executionPrice);
             
-            log.debug("模拟执行完成: {} 价格: {} 数量: {}", 
-                     order.getOrderId(), executionPrice, fillQuantity);
+            if (log.isDebugEnabled()) {
+                log.debug("模拟执行完成: {} 价格: {} 数量: {}", 
+                         order.getOrderId(), executionPrice, fillQuantity);
+            }
                      
         } catch (Exception e) {
             log.error("模拟执行失败: {}", order, e);
@@ -328,7 +330,9 @@ public class SimulatedExecutionHandler extends ExecutionHandler {
      */
     public void updateMarketData(Map<String, Bar> marketData) {
         this.currentMarketData.putAll(marketData);
-        log.debug("批量更新市场数据: {} 个标的", marketData.size());
+        if (log.isDebugEnabled()) {
+            log.debug("批量更新市场数据: {} 个标的", marketData.size());
+        }
     }
     
     /**
@@ -21,10 +21,13 @@ import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.stereotype.Component;
 
 import java.time.LocalDateTime;
+import java.time.ZoneOffset;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.Map;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.ToDoubleBiFunction;
 
 /**
  * 组合风控管理器
@@ -56,10 +59,32 @@ public class PortfolioManager implements EventHandler {
 
     // 持仓管理
     private final Map<String, Position> positions = new ConcurrentHashMap<>();
+    private final Map<String, Position> positionsView = Collections.unmodifiableMap(positions);
+
+    // 持仓版本号，每次成交更新持仓后递增，供依赖持仓的组件判断持仓是否变化
+    private final AtomicLong positionVersion = new AtomicLong(0);
 
     // 风控状态
     private final Map<String, RiskStatus> symbolRiskStatus = new ConcurrentHashMap<>();
 
+    // 风控参数（初始化时从配置读取并换算为比例，信号处理时直接使用）
+    private double maxPositionRatio;
+    private double maxTotalPositionRatio;
+    private double minOrderAmount;
+    private double defaultPositionSize;
+    private double maxDailyLossRatio;
+    private double maxDrawdownRatio;
+    private long signalCooldownSeconds;
+
+    // 仓位计算函数，初始化时按配置的仓位计算方法选定，信号处理时直接调用
+    private ToDoubleBiFunction<Signal, RiskSnapshot> positionSizer;
+
+    // 重复信号过滤表：按(策略, 标的, 方向)的哈希直接寻址，定长数组无需清理，冲突时新记录覆盖旧记录。
+    // 每个槽位占相邻两个元素[key, 秒级时间]，读写都在该数组的锁内进行，保证键和时间成对可见；
+    // 信号事件只由SIGNAL订阅者的处理线程处理，锁通常无竞争
+    private static final int SIGNAL_DEDUP_SLOTS = 4096;
+    private final long[] recentSignals = new long[SIGNAL_DEDUP_SLOTS * 2];
+
     // 统计信息
     private final AtomicLong totalSignals = new AtomicLong(0);
     private final AtomicLong passedSignals = new AtomicLong(0);
@@ -81,6 +106,29 @@ public class PortfolioManager implements EventHandler {
         }
     }
 
+    /**
+     * 风控检查用的账户估值快照
+     * <p>
+     * 总资产需要遍历持仓并查询最新行情，每个信号只估值一次，各项风控检查共享该结果。
+     */
+    private static class RiskSnapshot {
+        private final LocalDateTime time;
+        private final double totalAssets;
+        private final double positionValue;
+        private final double availableCash;
+
+        private RiskSnapshot(LocalDateTime time, double cash, double totalAssets, double availableCash) {
+            this.time = time;
+            this.totalAssets = totalAssets;
+            this.positionValue = totalAssets - cash;
+            this.availableCash = availableCash;
+        }
+
+        public double getTotalPositionRatio() {
+            return totalAssets > 0 ? positionValue / totalAssets : 0.0;
+        }
+    }
+
     @Override
     public String getName() {
         return "PortfolioManager";
@@ -93,6 +141,9 @@ public class PortfolioManager implements EventHandler {
         // 初始化账户
         initializeAccount();
 
+        // 加载风控参数
+        loadRiskLimits();
+
         // 注册事件处理器
         eventEngine.registerHandler(EventType.SIGNAL.name(), this);
         eventEngine.registerHandler(EventType.FILL.name(), this);
@@ -135,11 +186,24 @@ public class PortfolioManager implements EventHandler {
 
     /**
      * 获取所有持仓
+     * <p>
+     * 返回实时只读视图，不复制；需要稳定快照的调用方可自行new HashMap<>(...)
      *
-     * @return 持仓映射
+     * @return 持仓映射（只读）
      */
     public Map<String, Position> getAllPositions() {
-        return new HashMap<>(positions);
+        return positionsView;
+    }
+
+    /**
+     * 获取持仓版本号
+     * <p>
+     * 任一成交更新持仓后递增，版本号变化说明持仓可能发生了变化。
+     *
+     * @return 持仓版本号
+     */
+    public long getPositionVersion() {
+        return positionVersion.get();
     }
 
     /**
@@ -187,11 +251,7 @@ public class PortfolioManager implements EventHandler {
      * @return 总持仓比例
      */
     public double getTotalPositionRatio() {
-        double totalAssets = getTotalAssets();
-        if (totalAssets <= 0) {
-            return 0.0;
-        }
-        return (totalAssets - account.getCash()) / totalAssets;
+        return calculatePositionRatio(getTotalAssets());
     }
 
     /**
@@ -208,10 +268,11 @@ public class PortfolioManager implements EventHandler {
         stats.put("signalPassRate", totalSignals.get() > 0 ? 
                 (double) passedSignals.get() / totalSignals.get() : 0.0);
 
-        // 账户统计
-        stats.put("totalAssets", getTotalAssets());
+        // 账户统计（总资产需遍历持仓估值，只计算一次）
+        double totalAssets = getTotalAssets();
+        stats.put("totalAssets", totalAssets);
         stats.put("availableCash", getAvailableCash());
-        stats.put("totalPositionRatio", getTotalPositionRatio());
+        stats.put("totalPositionRatio", calculatePositionRatio(totalAssets));
         stats.put("positionCount", positions.size());
 
         // 风控统计
@@ -239,6 +300,52 @@ public class PortfolioManager implements EventHandler {
         log.info("账户初始化完成: ID={}, 初始资金={}", accountId, initialCapital);
     }
 
+    private void loadRiskLimits() {
+        QuantCapitalConfig.PortfolioConfig portfolioConfig = config.getPortfolio();
+        this.maxPositionRatio = portfolioConfig.getMaxPositionPercent() / 100.0;
+        this.maxTotalPositionRatio = portfolioConfig.getMaxTotalPositionPercent() / 100.0;
+        this.minOrderAmount = portfolioConfig.getMinOrderAmount();
+        this.defaultPositionSize = portfolioConfig.getDefaultPositionSize();
+        this.maxDailyLossRatio = portfolioConfig.getRisk().getMaxDailyLossPercent() / 100.0;
+        this.maxDrawdownRatio = portfolioConfig.getRisk().getMaxDrawdownPercent() / 100.0;
+        this.signalCooldownSeconds = portfolioConfig.getSignalCooldownSeconds();
+        this.positionSizer = createPositionSizer(portfolioConfig.getPositionSizeMethod());
+    }
+
+    /**
+     * 按仓位计算方法生成仓位计算函数
+     * <p>
+     * fixed_amount: 固定金额；percent_of_portfolio: 总资产乘单标的仓位上限；
+     * signal_strength: 固定金额按信号强度缩放
+     *
+     * @param method 仓位计算方法
+     * @return 仓位计算函数
+     */
+    private ToDoubleBiFunction<Signal, RiskSnapshot> createPositionSizer(String method) {
+        double positionSize = this.defaultPositionSize;
+        double positionRatio = this.maxPositionRatio;
+        return switch (method == null ? "fixed_amount" : method) {
+            case "fixed_amount" -> (signal, snapshot) -> positionSize;
+            case "percent_of_portfolio" -> (signal, snapshot) -> snapshot.totalAssets * positionRatio;
+            case "signal_strength" -> (signal, snapshot) -> positionSize * signal.getStrength();
+            default -> {
+                log.warn("未知的仓位计算方法: {}，使用固定金额", method);
+                yield (signal, snapshot) -> positionSize;
+            }
+        };
+    }
+
+    private double calculatePositionRatio(double totalAssets) {
+        if (totalAssets <= 0) {
+            return 0.0;
+        }
+        return (totalAssets - account.getCash()) / totalAssets;
+    }
+
+    private RiskSnapshot takeRiskSnapshot() {
+        return new RiskSnapshot(LocalDateTime.now(), account.getCash(), getTotalAssets(), getAvailableCash());
+    }
+
     private void handleSignalEvent(SignalEvent signalEvent) {
         totalSignals.incrementAndGet();
         
@@ -249,20 +356,32 @@ public class PortfolioManager implements EventHandler {
             return;
         }
 
-        log.debug("接收到信号: {} {} {} 强度:{}", 
-                signal.getSymbol(), signal.getDirection(), 
-                signal.getReferencePrice(), signal.getStrength());
+        if (log.isDebugEnabled()) {
+            log.debug("接收到信号: {} {} {} 强度:{}", 
+                    signal.getSymbol(), signal.getDirection(), 
+                    signal.getReferencePrice(), signal.getStrength());
+        }
+
+        // 冷却期内的重复信号
+        if (isDuplicateSignal(signal)) {
+            if (log.isDebugEnabled()) {
+                log.debug("重复信号，已忽略: {}", signal);
+            }
+            rejectedSignals.incrementAndGet();
+            return;
+        }
 
-        // 风控检查
-        if (!passRiskCheck(signal)) {
+        // 风控检查（账户估值只做一次，各项检查和订单计算共享）
+        RiskSnapshot snapshot = takeRiskSnapshot();
+        if (!passRiskCheck(signal, snapshot)) {
             rejectedSignals.incrementAndGet();
             return;
         }
 
         // 转换为订单
-        Order order = convertSignalToOrder(signal);
-        if (order != null) {
-            publishOrderEvent(order, signalEvent.getSignalId());
+        Order order = convertSignalToOrder(signal, snapshot);
+        if (order != null && publishOrderEvent(order, signalEvent)) {
+            recordSignal(signal);
             passedSignals.incrementAndGet();
             generatedOrders.incrementAndGet();
         } else {
@@ -277,11 +396,14 @@ public class PortfolioManager implements EventHandler {
             return;
         }
 
-        log.debug("接收到成交: {} {} {}@{}", 
-                fill.getSymbol(), fill.getSide(), fill.getQuantity(), fill.getPrice());
+        if (log.isDebugEnabled()) {
+            log.debug("接收到成交: {} {} {}@{}", 
+                    fill.getSymbol(), fill.getSide(), fill.getQuantity(), fill.getPrice());
+        }
 
         // 更新持仓
         updatePosition(fill);
+        positionVersion.incrementAndGet();
 
         // 更新账户
         updateAccount(fill);
@@ -296,7 +418,48 @@ public class PortfolioManager implements EventHandler {
         }
     }
 
-    private boolean passRiskCheck(Signal signal) {
+    private static long signalKey(Signal signal) {
+        long key = ((long) signal.getStrategyId().hashCode() << 32)
+                ^ (signal.getSymbol().hashCode() * 31L + signal.getDirection().ordinal());
+        // 0保留为空槽位标记
+        return key != 0 ? key : 1;
+    }
+
+    private static int signalSlot(long key) {
+        return (int) (key ^ (key >>> 32)) & (SIGNAL_DEDUP_SLOTS - 1);
+    }
+
+    private static long signalSeconds(Signal signal) {
+        return signal.getTimestamp().toEpochSecond(ZoneOffset.UTC);
+    }
+
+    private boolean isDuplicateSignal(Signal signal) {
+        if (signalCooldownSeconds <= 0) {
+            return false;
+        }
+        long key = signalKey(signal);
+        int index = signalSlot(key) << 1;
+        long seconds = signalSeconds(signal);
+        synchronized (recentSignals) {
+            return recentSignals[index] == key
+                    && seconds - recentSignals[index + 1] < signalCooldownSeconds;
+        }
+    }
+
+    private void recordSignal(Signal signal) {
+        if (signalCooldownSeconds <= 0) {
+            return;
+        }
+        long key = signalKey(signal);
+        int index = signalSlot(key) << 1;
+        long seconds = signalSeconds(signal);
+        synchronized (recentSignals) {
+            recentSignals[index] = key;
+            recentSignals[index + 1] = seconds;
+        }
+    }
+
+    private boolean passRiskCheck(Signal signal, RiskSnapshot snapshot) {
         String symbol = signal.getSymbol();
 
         // 1. 检查标的是否被风控屏蔽
@@ -307,65 +470,63 @@ public class PortfolioManager implements EventHandler {
         }
 
         // 2. 检查信号有效期
-        if (signal.isExpired(LocalDateTime.now())) {
+        if (signal.isExpired(snapshot.time)) {
             log.warn("信号已过期，被拒绝: {}", signal);
             return false;
         }
 
         // 3. 检查仓位限制
-        if (!checkPositionLimits(signal)) {
+        if (!checkPositionLimits(signal, snapshot)) {
             return false;
         }
 
         // 4. 检查资金限制
-        if (!checkCashLimits(signal)) {
+        if (!checkCashLimits(signal, snapshot)) {
             return false;
         }
 
         // 5. 检查日内风控限制
-        if (!checkDailyRiskLimits(signal)) {
+        if (!checkDailyRiskLimits(signal, snapshot)) {
             return false;
         }
 
         return true;
     }
 
-    private boolean checkPositionLimits(Signal signal) {
+    private boolean checkPositionLimits(Signal signal, RiskSnapshot snapshot) {
         String symbol = signal.getSymbol();
-        double maxPositionPercent = config.getPortfolio().getMaxPositionPercent() / 100.0;
-        double maxTotalPositionPercent = config.getPortfolio().getMaxTotalPositionPercent() / 100.0;
 
         // 检查单标的仓位限制
         Position position = positions.get(symbol);
         if (position != null) {
-            double totalAssets = getTotalAssets();
+            double totalAssets = snapshot.totalAssets;
             double currentPositionValue = Math.abs(position.getQuantity() * signal.getReferencePrice());
             double currentPositionRatio = currentPositionValue / totalAssets;
 
-            if (signal.isBuySignal() && currentPositionRatio >= maxPositionPercent) {
+            if (signal.isBuySignal() && currentPositionRatio >= maxPositionRatio) {
                 log.warn("单标的仓位超限，信号被拒绝: {} 当前仓位比例: {:.2f}%, 限制: {:.2f}%", 
-                        symbol, currentPositionRatio * 100, maxPositionPercent * 100);
+                        symbol, currentPositionRatio * 100, maxPositionRatio * 100);
                 return false;
             }
         }
 
         // 检查总仓位限制
-        if (signal.isBuySignal() && getTotalPositionRatio() >= maxTotalPositionPercent) {
+        double totalPositionRatio = snapshot.getTotalPositionRatio();
+        if (signal.isBuySignal() && totalPositionRatio >= maxTotalPositionRatio) {
             log.warn("总仓位超限，信号被拒绝: {} 当前总仓位比例: {:.2f}%, 限制: {:.2f}%", 
-                    symbol, getTotalPositionRatio() * 100, maxTotalPositionPercent * 100);
+                    symbol, totalPositionRatio * 100, maxTotalPositionRatio * 100);
             return false;
         }
 
         return true;
     }
 
-    private boolean checkCashLimits(Signal signal) {
+    private boolean checkCashLimits(Signal signal, RiskSnapshot snapshot) {
         if (!signal.isBuySignal()) {
             return true; // 卖出信号不需要检查资金
         }
 
-        double minOrderAmount = config.getPortfolio().getMinOrderAmount();
-        double orderAmount = calculateOrderAmount(signal);
+        double orderAmount = calculateOrderAmount(signal, snapshot);
 
         if (orderAmount < minOrderAmount) {
             log.warn("订单金额过小，信号被拒绝: {} 订单金额: {}, 最小金额: {}", 
@@ -373,25 +534,21 @@ public class PortfolioManager implements EventHandler {
             return false;
         }
 
-        if (orderAmount > getAvailableCash()) {
+        if (orderAmount > snapshot.availableCash) {
             log.warn("可用资金不足，信号被拒绝: {} 需要资金: {}, 可用资金: {}", 
-                    signal.getSymbol(), orderAmount, getAvailableCash());
+                    signal.getSymbol(), orderAmount, snapshot.availableCash);
             return false;
         }
 
         return true;
     }
 
-    private boolean checkDailyRiskLimits(Signal signal) {
+    private boolean checkDailyRiskLimits(Signal signal, RiskSnapshot snapshot) {
         String symbol = signal.getSymbol();
         RiskStatus riskStatus = symbolRiskStatus.get(symbol);
         
         if (riskStatus != null) {
-            double maxDailyLossPercent = config.getPortfolio().getRisk().getMaxDailyLossPercent() / 100.0;
-            double maxDrawdownPercent = config.getPortfolio().getRisk().getMaxDrawdownPercent() / 100.0;
-            double totalAssets = getTotalAssets();
-            
-            if (riskStatus.isRiskExceeded(totalAssets * maxDailyLossPercent, maxDrawdownPercent)) {
+            if (riskStatus.isRiskExceeded(snapshot.totalAssets * maxDailyLossRatio, maxDrawdownRatio)) {
                 log.warn("风控限制触发，信号被拒绝: {} 日内盈亏: {}, 最大回撤: {}", 
                         symbol, riskStatus.dailyPnL, riskStatus.maxDrawdown);
                 return false;
@@ -401,91 +558,94 @@ public class PortfolioManager implements EventHandler {
         return true;
     }
 
-    private double calculateOrderAmount(Signal signal) {
-        // 使用配置的默认仓位大小或信号建议的仓位大小
-        double positionSize = signal.getSuggestedPositionSize() != null ? 
-                signal.getSuggestedPositionSize() : 
-                config.getPortfolio().getDefaultPositionSize();
-        
-        return positionSize;
+    private double calculateOrderAmount(Signal signal, RiskSnapshot snapshot) {
+        // 优先使用信号建议的仓位大小，否则按配置的仓位计算方法
+        Double suggestedPositionSize = signal.getSuggestedPositionSize();
+        return suggestedPositionSize != null ? suggestedPositionSize : positionSizer.applyAsDouble(signal, snapshot);
     }
 
-    private Order convertSignalToOrder(Signal signal) {
-        try {
-            double orderAmount = calculateOrderAmount(signal);
-            int quantity = (int) (orderAmount / signal.getReferencePrice() / 100) * 100; // 100股整数倍
-            
-            if (quantity <= 0) {
-                log.warn("计算的订单数量为0，信号转换失败: {}", signal);
-                return null;
-            }
+    /**
+     * 按最小交易单位（100股）向下取整计算下单数量
+     *
+     * @param orderAmount 下单金额
+     * @param price       参考价格
+     * @return 下单数量
+     */
+    private static int calculateLotQuantity(double orderAmount, double price) {
+        return (int) (orderAmount / price / 100) * 100;
+    }
 
-            OrderSide side = signal.isBuySignal() ? OrderSide.BUY : OrderSide.SELL;
-            OrderType orderType = OrderType.LIMIT; // 默认使用限价单
-            
-            Order order = new Order(
-                    signal.getSymbol(),
-                    orderType,
-                    side,
-                    quantity,
-                    signal.getReferencePrice(),
-                    signal.getStrategyId()
-            );
-            
-            order.setSignalId(signal.getSignalId());
-            order.setTag("来自信号: " + signal.getReason());
-            
+    private Order convertSignalToOrder(Signal signal, RiskSnapshot snapshot) {
+        // 信号已通过isValid校验（参考价格为正），以下计算不会抛出异常
+        double orderAmount = calculateOrderAmount(signal, snapshot);
+        int quantity = calculateLotQuantity(orderAmount, signal.getReferencePrice());
+        
+        if (quantity <= 0) {
+            log.warn("计算的订单数量为0，信号转换失败: {}", signal);
+            return null;
+        }
+
+        OrderSide side = signal.isBuySignal() ? OrderSide.BUY : OrderSide.SELL;
+        OrderType orderType = OrderType.LIMIT; // 默认使用限价单
+        
+        Order order = new Order(
+                signal.getSymbol(),
+                orderType,
+                side,
+                quantity,
+                signal.getReferencePrice(),
+                signal.getStrategyId()
+        );
+        
+        order.setSignalId(signal.getSignalId());
+        order.setTag("来自信号: " + signal.getReason());
+        
+        if (log.isDebugEnabled()) {
             log.debug("信号转换为订单: {} {} {}@{}", 
                     order.getSymbol(), order.getSide(), order.getQuantity(), order.getPrice());
-            
-            return order;
-            
-        } catch (Exception e) {
-            log.error("信号转换为订单失败: {}", signal, e);
-            return null;
         }
+        
+        return order;
     }
 
-    private void publishOrderEvent(Order order, String signalId) {
-        try {
-            OrderEvent orderEvent = new OrderEvent(LocalDateTime.now(), order, OrderAction.NEW, signalId);
-            eventEngine.publishEvent(orderEvent);
-            
+    private boolean publishOrderEvent(Order order, SignalEvent signalEvent) {
+        // 订单事件沿用触发信号的事件时间
+        OrderEvent orderEvent = new OrderEvent(signalEvent.getTimestamp(), order, OrderAction.NEW,
+                signalEvent.getSignalId());
+        
+        // publishEvent内部处理入队异常并记录日志，这里只需根据结果判断
+        boolean published = eventEngine.publishEvent(orderEvent);
+        if (published && log.isDebugEnabled()) {
             log.debug("发布订单事件: {} {} {}@{}", 
                     order.getSymbol(), order.getSide(), order.getQuantity(), order.getPrice());
-                    
-        } catch (Exception e) {
-            log.error("发布订单事件失败: order={}", order, e);
         }
+        return published;
     }
 
     private void updatePosition(Fill fill) {
         String symbol = fill.getSymbol();
         Position position = positions.computeIfAbsent(symbol, k -> 
-                Position.builder().symbol(symbol).quantity(0).avgPrice(0.0).build());
+                Position.builder().symbol(symbol).quantity(0).avgPrice(0.0)
+                        .strategyId(fill.getStrategyId()).build());
+        if (position.getQuantity() == 0) {
+            // 空仓后重新开仓，归属到本次成交的策略
+            position.setStrategyId(fill.getStrategyId());
+        }
 
         // 更新持仓
         int oldQuantity = position.getQuantity();
         double oldAvgPrice = position.getAvgPrice();
         
-        if (fill.getSide() == OrderSide.BUY) {
-            // 买入更新
-            double totalValue = oldQuantity * oldAvgPrice + fill.getQuantity() * fill.getPrice();
-            int newQuantity = oldQuantity + fill.getQuantity();
-            double newAvgPrice = newQuantity > 0 ? totalValue / newQuantity : 0.0;
-            
-            position.setQuantity(newQuantity);
-            position.setAvgPrice(newAvgPrice);
-        } else {
-            // 卖出更新
-            position.setQuantity(oldQuantity - fill.getQuantity());
-            // 卖出不改变平均成本
-        }
+        // 加仓按加权平均更新成本，减仓成本不变，反向开仓以成交价为成本
+        int quantityChange = fill.getSide() == OrderSide.BUY ? fill.getQuantity() : -fill.getQuantity();
+        position.updatePosition(quantityChange, fill.getPrice());
         
         position.setLastUpdateTime(fill.getTimestamp());
         
-        log.debug("持仓更新: {} 数量: {} -> {} 均价: {:.3f} -> {:.3f}", 
-                symbol, oldQuantity, position.getQuantity(), oldAvgPrice, position.getAvgPrice());
+        if (log.isDebugEnabled()) {
+            log.debug("持仓更新: {} 数量: {} -> {} 均价: {} -> {}", 
+                    symbol, oldQuantity, position.getQuantity(), oldAvgPrice, position.getAvgPrice());
+        }
     }
 
     private void updateAccount(Fill fill) {
@@ -493,10 +653,11 @@ public class PortfolioManager implements EventHandler {
         
         account.setCash(account.getCash() + cashChange);
         account.setAvailableCash(account.getAvailableCash() + cashChange);
-        account.setTotalAssets(getTotalAssets());
         
-        log.debug("账户更新: 现金变化: {:.2f}, 可用现金: {:.2f}, 总资产: {:.2f}", 
-                cashChange, account.getAvailableCash(), account.getTotalAssets());
+        if (log.isDebugEnabled()) {
+            log.debug("账户更新: 现金变化: {}, 可用现金: {}", 
+                    cashChange, account.getAvailableCash());
+        }
     }
 
     private void updateRiskStatus(Fill fill) {
@@ -508,23 +669,28 @@ public class PortfolioManager implements EventHandler {
         riskStatus.dailyPnL += pnl;
         riskStatus.lastTradeTime = fill.getTimestamp();
         
-        log.debug("风控状态更新: {} 日内盈亏: {:.2f}", symbol, riskStatus.dailyPnL);
+        if (log.isDebugEnabled()) {
+            log.debug("风控状态更新: {} 日内盈亏: {}", symbol, riskStatus.dailyPnL);
+        }
     }
 
     private void performRiskCheck() {
         // 定期风控检查
         log.debug("执行定期风控检查...");
         
+        if (symbolRiskStatus.isEmpty()) {
+            return;
+        }
+        
+        // 总资产对所有标的相同，整轮检查只估值一次
+        double maxDailyLoss = getTotalAssets() * maxDailyLossRatio;
+        
         // 检查各标的风控状态
         for (Map.Entry<String, RiskStatus> entry : symbolRiskStatus.entrySet()) {
             String symbol = entry.getKey();
             RiskStatus riskStatus = entry.getValue();
             
-            double maxDailyLossPercent = config.getPortfolio().getRisk().getMaxDailyLossPercent() / 100.0;
-            double maxDrawdownPercent = config.getPortfolio().getRisk().getMaxDrawdownPercent() / 100.0;
-            double totalAssets = getTotalAssets();
-            
-            if (riskStatus.isRiskExceeded(totalAssets * maxDailyLossPercent, maxDrawdownPercent)) {
+            if (riskStatus.isRiskExceeded(maxDailyLoss, maxDrawdownRatio)) {
                 if (!riskStatus.isBlocked) {
                     riskStatus.isBlocked = true;
                     riskStatus.blockReason = "风控限制触发";
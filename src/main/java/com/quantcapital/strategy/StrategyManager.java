@@ -10,6 +10,7 @@ import com.quantcapital.entities.event.FillEvent;
 import com.quantcapital.entities.event.MarketEvent;
 import com.quantcapital.entities.event.SignalEvent;
 import com.quantcapital.entities.event.TimerEvent;
+import com.quantcapital.portfolio.PortfolioManager;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.stereotype.Component;
@@ -41,10 +42,16 @@ public class StrategyManager implements EventHandler {
     @Autowired
     private QuantCapitalConfig config;
 
+    @Autowired
+    private PortfolioManager portfolioManager;
+
     // 策略映射
     private final Map<String, BaseStrategy> strategies = new ConcurrentHashMap<>();
     private final Map<String, StrategyContext> strategyContexts = new ConcurrentHashMap<>();
 
+    // 关注标的缓存对应的持仓版本号，只在市场事件处理线程中读写
+    private long watchPositionVersion = -1;
+
     // 统计信息
     private final AtomicLong totalEvents = new AtomicLong(0);
     private final AtomicLong processedEvents = new AtomicLong(0);
@@ -62,12 +69,14 @@ public class StrategyManager implements EventHandler {
         private final AtomicLong processedEvents;
         private final AtomicLong generatedSignals;
         private final AtomicLong errors;
+        // 关注标的缓存，市场事件分发时直接查询，避免每个事件都调用getWatchSymbols
+        private volatile Set<String> watchSymbols = Collections.emptySet();
 
         public StrategyContext(BaseStrategy strategy, Map<String, Object> config) {
             this.strategy = strategy;
             this.config = new HashMap<>(config);
             this.registeredTime = LocalDateTime.now();
-            this.lastActiveTime = LocalDateTime.now();
+            this.lastActiveTime = this.registeredTime;
             this.receivedEvents = new AtomicLong(0);
             this.processedEvents = new AtomicLong(0);
             this.generatedSignals = new AtomicLong(0);
@@ -78,6 +87,20 @@ public class StrategyManager implements EventHandler {
             this.lastActiveTime = LocalDateTime.now();
         }
 
+        public void updateActivity(LocalDateTime time) {
+            this.lastActiveTime = time;
+        }
+
+        /**
+         * 刷新关注标的缓存
+         * 关注标的随持仓和配置变化，在启动、配置更新、本策略成交和定时器事件后刷新；
+         * 任一策略的成交改变持仓后，分发下一个市场事件前刷新所有策略
+         */
+        public void refreshWatchSymbols() {
+            List<String> symbols = strategy.getWatchSymbols();
+            this.watchSymbols = symbols != null ? Set.copyOf(symbols) : Collections.emptySet();
+        }
+
         public Map<String, Object> getStatistics() {
             return Map.of(
                     "strategyId", strategy.getStrategyId(),
@@ -171,6 +194,7 @@ public class StrategyManager implements EventHandler {
             
             // 创建策略上下文
             StrategyContext context = new StrategyContext(strategy, config);
+            context.refreshWatchSymbols();
             
             // 注册策略
             strategies.put(strategyId, strategy);
@@ -224,6 +248,10 @@ public class StrategyManager implements EventHandler {
 
         try {
             strategy.start();
+            StrategyContext context = strategyContexts.get(strategyId);
+            if (context != null) {
+                context.refreshWatchSymbols();
+            }
             log.info("策略启动成功: {}", strategyId);
         } catch (Exception e) {
             log.error("策略启动失败: {}", strategyId, e);
@@ -286,6 +314,7 @@ public class StrategyManager implements EventHandler {
         try {
             strategy.updateConfig(config);
             context.config.putAll(config);
+            context.refreshWatchSymbols();
             context.updateActivity();
             
             log.info("策略配置更新成功: {}", strategyId);
@@ -346,21 +375,28 @@ public class StrategyManager implements EventHandler {
      * @return 统计信息
      */
     public Map<String, Object> getStatistics() {
+        long total = totalEvents.get();
+        long processed = processedEvents.get();
+        
+        // 一次遍历同时统计运行中数量和按类型分布
+        long runningCount = 0;
+        Map<String, Long> typeStats = new HashMap<>();
+        for (BaseStrategy strategy : strategies.values()) {
+            if (strategy.getStatus() == StrategyStatus.RUNNING) {
+                runningCount++;
+            }
+            typeStats.merge(strategy.getStrategyType().toString(), 1L, Long::sum);
+        }
+        
         Map<String, Object> stats = new HashMap<>();
         stats.put("totalStrategies", strategies.size());
-        stats.put("runningStrategies", getRunningStrategyCount());
-        stats.put("totalEvents", totalEvents.get());
-        stats.put("processedEvents", processedEvents.get());
+        stats.put("runningStrategies", runningCount);
+        stats.put("totalEvents", total);
+        stats.put("processedEvents", processed);
         stats.put("failedEvents", failedEvents.get());
-        stats.put("successRate", processedEvents.get() > 0 ? 
-                (double) processedEvents.get() / totalEvents.get() : 0.0);
+        stats.put("successRate", processed > 0 ? (double) processed / total : 0.0);
         
         // 按策略类型统计
-        Map<String, Long> typeStats = new HashMap<>();
-        strategies.values().forEach(strategy -> {
-            String type = strategy.getStrategyType().toString();
-            typeStats.merge(type, 1L, Long::sum);
-        });
         stats.put("strategiesByType", typeStats);
         
         return stats;
@@ -370,19 +406,21 @@ public class StrategyManager implements EventHandler {
 
     private void handleMarketEvent(MarketEvent marketEvent) {
         String symbol = marketEvent.getSymbol();
+        LocalDateTime now = LocalDateTime.now();
+
+        refreshWatchSymbolsOnPositionChange();
         
         // 分发给关注该标的的策略
-        for (Map.Entry<String, BaseStrategy> entry : strategies.entrySet()) {
-            String strategyId = entry.getKey();
-            BaseStrategy strategy = entry.getValue();
-            StrategyContext context = strategyContexts.get(strategyId);
+        // 上下文持有策略引用，直接遍历上下文，省去按ID二次查找
+        for (StrategyContext context : strategyContexts.values()) {
+            BaseStrategy strategy = context.strategy;
             
-            if (context == null || strategy.getStatus() != StrategyStatus.RUNNING) {
+            if (strategy.getStatus() != StrategyStatus.RUNNING) {
                 continue;
             }
             
             // 检查策略是否关注该标的
-            if (!strategy.getWatchSymbols().contains(symbol)) {
+            if (!context.watchSymbols.contains(symbol)) {
                 continue;
             }
             
@@ -394,18 +432,41 @@ public class StrategyManager implements EventHandler {
                 
                 // 发布生成的信号
                 if (signals != null && !signals.isEmpty()) {
+                    List<SignalEvent> signalEvents = new ArrayList<>(signals.size());
                     for (Signal signal : signals) {
-                        publishSignalEvent(signal, marketEvent.getEventId());
-                        context.generatedSignals.incrementAndGet();
+                        signalEvents.add(newSignalEvent(signal, marketEvent));
                     }
+                    publishSignalEvents(signalEvents);
+                    context.generatedSignals.addAndGet(signals.size());
                 }
                 
                 context.processedEvents.incrementAndGet();
-                context.updateActivity();
+                context.updateActivity(now);
                 
             } catch (Exception e) {
                 context.errors.incrementAndGet();
-                log.error("策略处理市场事件失败: strategyId={}, symbol={}", strategyId, symbol, e);
+                log.error("策略处理市场事件失败: strategyId={}, symbol={}", strategy.getStrategyId(), symbol, e);
+            }
+        }
+    }
+
+    /**
+     * 持仓变化后刷新所有策略的关注标的
+     * <p>
+     * 止盈止损和通用止损策略关注其他策略开出的持仓，但成交事件只分发给下单的策略；
+     * 持仓版本号在组合管理器更新持仓后递增，先读版本号再刷新，刷新期间的新成交会在下一个事件时再次刷新。
+     */
+    private void refreshWatchSymbolsOnPositionChange() {
+        long version = portfolioManager.getPositionVersion();
+        if (version == watchPositionVersion) {
+            return;
+        }
+        watchPositionVersion = version;
+        for (StrategyContext context : strategyContexts.values()) {
+            try {
+                context.refreshWatchSymbols();
+            } catch (Exception e) {
+                log.error("刷新策略关注标的失败: strategyId={}", context.strategy.getStrategyId(), e);
             }
         }
     }
@@ -416,16 +477,15 @@ public class StrategyManager implements EventHandler {
             return;
         }
         
-        BaseStrategy strategy = strategies.get(strategyId);
         StrategyContext context = strategyContexts.get(strategyId);
-        
-        if (strategy == null || context == null) {
+        if (context == null) {
             return;
         }
         
         try {
             context.receivedEvents.incrementAndGet();
-            strategy.onFillEvent(fillEvent);
+            context.strategy.onFillEvent(fillEvent);
+            context.refreshWatchSymbols();
             context.processedEvents.incrementAndGet();
             context.updateActivity();
             
@@ -436,39 +496,48 @@ public class StrategyManager implements EventHandler {
     }
 
     private void handleTimerEvent(TimerEvent timerEvent) {
+        LocalDateTime now = LocalDateTime.now();
+        
         // 分发给所有运行中的策略
-        for (Map.Entry<String, BaseStrategy> entry : strategies.entrySet()) {
-            String strategyId = entry.getKey();
-            BaseStrategy strategy = entry.getValue();
-            StrategyContext context = strategyContexts.get(strategyId);
+        // 上下文持有策略引用，直接遍历上下文，省去按ID二次查找
+        for (StrategyContext context : strategyContexts.values()) {
+            BaseStrategy strategy = context.strategy;
             
-            if (context == null || strategy.getStatus() != StrategyStatus.RUNNING) {
+            if (strategy.getStatus() != StrategyStatus.RUNNING) {
                 continue;
             }
             
             try {
                 context.receivedEvents.incrementAndGet();
                 strategy.onTimerEvent(timerEvent);
+                context.refreshWatchSymbols();
                 context.processedEvents.incrementAndGet();
-                context.updateActivity();
+                context.updateActivity(now);
                 
             } catch (Exception e) {
                 context.errors.incrementAndGet();
-                log.error("策略处理定时器事件失败: strategyId={}", strategyId, e);
+                log.error("策略处理定时器事件失败: strategyId={}", strategy.getStrategyId(), e);
             }
         }
     }
 
-    private void publishSignalEvent(Signal signal, String triggerMarketEventId) {
-        try {
-            SignalEvent signalEvent = new SignalEvent(LocalDateTime.now(), signal, triggerMarketEventId);
-            eventEngine.publishEvent(signalEvent);
-            
-            log.debug("发布信号事件: strategyId={}, symbol={}, direction={}", 
-                    signal.getStrategyId(), signal.getSymbol(), signal.getDirection());
-                    
-        } catch (Exception e) {
-            log.error("发布信号事件失败: signal={}", signal, e);
+    private SignalEvent newSignalEvent(Signal signal, MarketEvent marketEvent) {
+        // 信号事件沿用触发行情的事件时间
+        return new SignalEvent(marketEvent.getTimestamp(), signal, marketEvent.getEventId());
+    }
+
+    private void publishSignalEvents(List<SignalEvent> signalEvents) {
+        // 同一次策略调用产生的信号一次性入队
+        int published = eventEngine.publishEvents(signalEvents);
+        if (log.isDebugEnabled()) {
+            for (SignalEvent signalEvent : signalEvents) {
+                Signal signal = signalEvent.getSignal();
+                log.debug("发布信号事件: strategyId={}, symbol={}, direction={}", 
+                        signal.getStrategyId(), signal.getSymbol(), signal.getDirection());
+            }
+            if (published < signalEvents.size()) {
+                log.debug("部分信号事件未能发布: {}/{}", published, signalEvents.size());
+            }
         }
     }
 }
\ No newline at end of file
@@ -0,0 +1,107 @@
+package com.quantcapital;
+
+import com.quantcapital.engine.SpscRingBuffer;
+import org.junit.jupiter.api.Test;
+
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicReference;
+
+import static org.assertj.core.api.Assertions.*;
+
+/**
+ * SPSC环形缓冲区单元测试
+ *
+ * 测试内容：
+ * 1. 容量向上取整为2的幂
+ * 2. 先进先出、满时拒绝写入、空时返回null
+ * 3. 游标多次绕回后数据正确
+ * 4. 单生产者单消费者并发时元素不丢失、不乱序
+ *
+ * @author QuantCapital Team
+ */
+class SpscRingBufferTest {
+
+    @Test
+    void testCapacityRoundedUpToPowerOfTwo() {
+        assertThat(new SpscRingBuffer<Integer>(1).capacity()).isEqualTo(1);
+        assertThat(new SpscRingBuffer<Integer>(8).capacity()).isEqualTo(8);
+        assertThat(new SpscRingBuffer<Integer>(100).capacity()).isEqualTo(128);
+        assertThatThrownBy(() -> new SpscRingBuffer<Integer>(0))
+                .isInstanceOf(IllegalArgumentException.class);
+    }
+
+    @Test
+    void testFifoAndBounds() {
+        SpscRingBuffer<Integer> buffer = new SpscRingBuffer<>(4);
+        assertThat(buffer.isEmpty()).isTrue();
+        assertThat(buffer.poll()).isNull();
+
+        for (int i = 0; i < 4; i++) {
+            assertThat(buffer.offer(i)).isTrue();
+        }
+        // 已满时拒绝写入
+        assertThat(buffer.offer(4)).isFalse();
+        assertThat(buffer.size()).isEqualTo(4);
+
+        for (int i = 0; i < 4; i++) {
+            assertThat(buffer.poll()).isEqualTo(i);
+        }
+        assertThat(buffer.poll()).isNull();
+        assertThat(buffer.isEmpty()).isTrue();
+
+        assertThatThrownBy(() -> buffer.offer(null)).isInstanceOf(NullPointerException.class);
+    }
+
+    @Test
+    void testWrapAround() {
+        SpscRingBuffer<Integer> buffer = new SpscRingBuffer<>(4);
+        int next = 0;
+        int expected = 0;
+        for (int round = 0; round < 100; round++) {
+            // 每轮写3读3，游标不与容量对齐，反复跨越数组末尾
+            for (int i = 0; i < 3; i++) {
+                assertThat(buffer.offer(next++)).isTrue();
+            }
+            for (int i = 0; i < 3; i++) {
+                assertThat(buffer.poll()).isEqualTo(expected++);
+            }
+        }
+        assertThat(buffer.isEmpty()).isTrue();
+    }
+
+    @Test
+    void testConcurrentProducerConsumer() throws InterruptedException {
+        final int count = 1_000_000;
+        SpscRingBuffer<Integer> buffer = new SpscRingBuffer<>(1024);
+        AtomicReference<String> error = new AtomicReference<>();
+
+        Thread consumer = new Thread(() -> {
+            int expected = 0;
+            while (expected < count) {
+                Integer value = buffer.poll();
+                if (value == null) {
+                    Thread.onSpinWait();
+                    continue;
+                }
+                if (value != expected) {
+                    error.set("期望 " + expected + " 实际 " + value);
+                    return;
+                }
+                expected++;
+            }
+        });
+        consumer.start();
+
+        for (int i = 0; i < count && error.get() == null; i++) {
+            // 消费者出错退出后不再等待空位
+            while (!buffer.offer(i) && error.get() == null) {
+                Thread.onSpinWait();
+            }
+        }
+
+        consumer.join(TimeUnit.SECONDS.toMillis(30));
+        assertThat(consumer.isAlive()).isFalse();
+        assertThat(error.get()).isNull();
+        assertThat(buffer.isEmpty()).isTrue();
+    }
+}
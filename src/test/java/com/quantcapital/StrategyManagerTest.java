@@ -0,0 +1,102 @@
+package com.quantcapital;
+
+import com.quantcapital.config.QuantCapitalConfig;
+import com.quantcapital.data.DataHandler;
+import com.quantcapital.engine.EventEngine;
+import com.quantcapital.entities.Bar;
+import com.quantcapital.entities.Fill;
+import com.quantcapital.entities.constant.Frequency;
+import com.quantcapital.entities.constant.OrderSide;
+import com.quantcapital.entities.event.FillEvent;
+import com.quantcapital.entities.event.MarketEvent;
+import com.quantcapital.portfolio.PortfolioManager;
+import com.quantcapital.strategy.BaseStrategy;
+import com.quantcapital.strategy.StrategyManager;
+import com.quantcapital.strategy.StrategyStatus;
+import com.quantcapital.strategy.StrategyType;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.test.util.ReflectionTestUtils;
+
+import java.time.LocalDateTime;
+import java.util.List;
+import java.util.Map;
+
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.Mockito.*;
+
+/**
+ * 策略管理器单元测试
+ *
+ * 测试关注标的缓存：其他策略的成交改变持仓后，
+ * 依赖持仓的止盈止损策略能收到新持仓标的的市场事件。
+ *
+ * @author QuantCapital Team
+ */
+class StrategyManagerTest {
+
+    private static final String SYMBOL = "000001.SZ";
+
+    private PortfolioManager portfolioManager;
+    private StrategyManager strategyManager;
+
+    @BeforeEach
+    void setUp() {
+        EventEngine eventEngine = mock(EventEngine.class);
+        QuantCapitalConfig config = new QuantCapitalConfig();
+
+        portfolioManager = new PortfolioManager();
+        ReflectionTestUtils.setField(portfolioManager, "eventEngine", eventEngine);
+        ReflectionTestUtils.setField(portfolioManager, "dataHandler", mock(DataHandler.class));
+        ReflectionTestUtils.setField(portfolioManager, "config", config);
+        portfolioManager.initialize();
+
+        strategyManager = new StrategyManager();
+        ReflectionTestUtils.setField(strategyManager, "eventEngine", eventEngine);
+        ReflectionTestUtils.setField(strategyManager, "config", config);
+        ReflectionTestUtils.setField(strategyManager, "portfolioManager", portfolioManager);
+    }
+
+    @Test
+    void testExitStrategyWatchesPositionOpenedByOtherStrategy() throws Exception {
+        // 止盈止损策略关注组合中的全部持仓
+        BaseStrategy exitStrategy = mock(BaseStrategy.class);
+        when(exitStrategy.getStrategyId()).thenReturn("exit-strategy");
+        when(exitStrategy.getStrategyType()).thenReturn(StrategyType.EXIT);
+        when(exitStrategy.getStatus()).thenReturn(StrategyStatus.RUNNING);
+        when(exitStrategy.getWatchSymbols())
+                .thenAnswer(invocation -> List.copyOf(portfolioManager.getAllPositions().keySet()));
+        when(exitStrategy.onMarketEvent(any())).thenReturn(List.of());
+        strategyManager.registerStrategy(exitStrategy, Map.of());
+
+        // 尚无持仓时不分发
+        strategyManager.handleEvent(newMarketEvent());
+        verify(exitStrategy, never()).onMarketEvent(any());
+
+        // 开单策略成交，成交事件只属于开单策略
+        FillEvent fillEvent = new FillEvent(LocalDateTime.now(), new Fill("order-1", SYMBOL, OrderSide.BUY,
+                100, 10.5, LocalDateTime.now(), "entry-strategy"));
+        portfolioManager.handleEvent(fillEvent);
+        strategyManager.handleEvent(fillEvent);
+
+        // 新持仓标的的市场事件分发给止盈止损策略
+        MarketEvent marketEvent = newMarketEvent();
+        strategyManager.handleEvent(marketEvent);
+        verify(exitStrategy).onMarketEvent(marketEvent);
+    }
+
+    private static MarketEvent newMarketEvent() {
+        Bar bar = Bar.builder()
+                .symbol(SYMBOL)
+                .datetime(LocalDateTime.now())
+                .frequency(Frequency.DAILY)
+                .open(10.0)
+                .high(11.0)
+                .low(9.5)
+                .close(10.5)
+                .volume(1000000)
+                .amount(10500000.0)
+                .build();
+        return new MarketEvent(LocalDateTime.now(), bar, Frequency.DAILY);
+    }
+}